@@ -5,11 +5,33 @@ Provides authentication and API access to Ellucian's support portal
 to minimize re-authentication.
 """
 
-from .auth import AuthenticationError, AuthSession
-from .client import EllucianClient, EllucianCredentials
-from .fetch import FetchError, KBArticle, fetch_attachments, fetch_kb_article
-from .search import SearchError, SearchResponse, SearchResult, search
+from importlib import import_module
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from .auth import AuthenticationError, AuthSession
+    from .client import EllucianClient, EllucianCredentials
+    from .fetch import FetchError, KBArticle, fetch_attachments, fetch_kb_article
+    from .search import SearchError, SearchResponse, SearchResult, search
+
+# Public name -> defining submodule. Resolved on first access so that
+# importing a single submodule (e.g. the CLI) doesn't load all of them.
+_EXPORTS = {
+    "EllucianClient": ".client",
+    "EllucianCredentials": ".client",
+    "AuthSession": ".auth",
+    "AuthenticationError": ".auth",
+    "SearchError": ".search",
+    "SearchResponse": ".search",
+    "SearchResult": ".search",
+    "search": ".search",
+    "FetchError": ".fetch",
+    "KBArticle": ".fetch",
+    "fetch_kb_article": ".fetch",
+    "fetch_attachments": ".fetch",
+}
+
+# Spelled out (not list(_EXPORTS)) so linters can see the TYPE_CHECKING imports are re-exported
 __all__ = [
     "EllucianClient",
     "EllucianCredentials",
@@ -24,3 +46,12 @@ __all__ = [
     "fetch_kb_article",
     "fetch_attachments",
 ]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -8,11 +8,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable
 
-import httpx
-
 # Default cookie storage location
 DEFAULT_COOKIE_FILE = Path.home() / ".config" / "stibbons" / "ellucian_cookies.json"
 
+# Sessions already read from disk this process: path -> (mtime_ns, session)
+_session_cache: dict[Path, tuple[int, "AuthSession"]] = {}
+
 
 @dataclass
 class AuthSession:
@@ -37,15 +38,26 @@ class AuthSession:
             "glide_session_store": self.glide_session_store,
         }
         path.write_text(json.dumps(data, indent=2))
+        _session_cache.pop(path, None)
 
     @classmethod
     def load(cls, path: Path = DEFAULT_COOKIE_FILE) -> "AuthSession | None":
-        """Load session from file if exists and valid."""
-        if not path.exists():
+        """Load session from file if exists and valid.
+
+        The parsed session is cached per path and reused until the file's
+        mtime changes, so repeated loads in one process hit the disk once.
+        """
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            _session_cache.pop(path, None)
             return None
+        cached = _session_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
         try:
             data = json.loads(path.read_text())
-            return cls(
+            session = cls(
                 cookies=data.get("cookies", {}),
                 user_email=data.get("user_email", ""),
                 user_id=data.get("user_id", ""),
@@ -53,10 +65,13 @@ class AuthSession:
             )
         except (json.JSONDecodeError, KeyError):
             return None
+        _session_cache[path] = (mtime, session)
+        return session
 
     @staticmethod
     def clear(path: Path = DEFAULT_COOKIE_FILE) -> None:
         """Delete saved session."""
+        _session_cache.pop(path, None)
         if path.exists():
             path.unlink()
 
@@ -92,6 +107,9 @@ class OktaAuthenticator:
         self.username = username
         self.password = password
         self.mfa_callback = mfa_callback
+
+        import httpx
+
         self._client = httpx.Client(
             follow_redirects=False,
             timeout=30.0,
@@ -399,6 +417,8 @@ class OktaAuthenticator:
         if not session.is_authenticated:
             return False
 
+        import httpx
+
         # Make a test request to see if we're still logged in
         with httpx.Client(timeout=30.0) as client:
             # Set cookies from session
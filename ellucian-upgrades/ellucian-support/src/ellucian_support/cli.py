@@ -1,50 +1,91 @@
 """CLI for Ellucian Support Center."""
 
+import contextlib
+import functools
+import inspect
 import os
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import httpx
+import orjson
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from .auth import AuthSession, OktaAuthenticator
-from .client import EllucianClient, EllucianCredentials
-from .download import DownloadCenterError, FlexNetClient
-from .fetch import FetchError, fetch_attachments, fetch_kb_article
-from .release import (
-    ReleaseError,
-    enrich_release,
-    get_release,
-    get_release_with_details,
-    search_releases,
-)
-from .search import SearchError, search
-from .ticket import TicketError, add_comment, get_comments, get_ticket, list_tickets
+
+if TYPE_CHECKING:
+    import httpx
 
 app = typer.Typer(help="Ellucian Support Center CLI")
-console = Console()
 
 
+@functools.cache
+def _rich_console():
+    """Create the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+class _LazyConsole:
+    """Proxy for the Rich console so --json runs that print nothing else never import Rich."""
+
+    def __getattr__(self, name):
+        return getattr(_rich_console(), name)
+
+
+console = _LazyConsole()
+
+
+def _print_json(obj) -> None:
+    """Write obj as JSON straight to stdout, bypassing Rich rendering."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.buffer.flush()
+
+
+def _trunc(text: str, width: int) -> str:
+    """Truncate text to width characters, ending with "..." when cut."""
+    return text if len(text) <= width else f"{text[:width - 3]}..."
+
+
+def _format_size(size: int) -> str:
+    """Format a byte count as "N B", or "N.N KB" above 1 KB."""
+    return f"{size / 1024:.1f} KB" if size > 1024 else f"{size} B"
+
+
+def _table(*args, **kwargs):
+    """Build a Rich table, importing rich.table only for human-readable output."""
+    from rich.table import Table
+
+    return Table(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=1)
 def load_env():
-    """Load environment from local.env if present."""
+    """Load environment from local.env if present (once per process)."""
     # Try project root first, then parent directories
-    for parent in [Path.cwd()] + list(Path.cwd().parents)[:3]:
+    cwd = Path.cwd()
+    for parent in (cwd, *cwd.parents[:3]):
         env_file = parent / "local.env"
-        if env_file.exists():
-            with open(env_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, _, value = line.partition("=")
-                        value = value.strip().strip('"').strip("'")
-                        os.environ.setdefault(key.strip(), value)
-            break
+        try:
+            text = env_file.read_text()
+        except (FileNotFoundError, IsADirectoryError):
+            continue
+        for line in text.splitlines():
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                value = value.strip().strip('"').strip("'")
+                os.environ.setdefault(key.strip(), value)
+        break
 
 
 @app.command()
 def login(force: bool = typer.Option(False, "--force", "-f", help="Force re-authentication")):
     """Authenticate with Ellucian Support Center."""
+    from .client import EllucianClient, EllucianCredentials
+
     load_env()
 
     try:
@@ -90,6 +131,41 @@ def logout():
     console.print("[green]Session cleared[/green]")
 
 
+@functools.lru_cache(maxsize=1)
+def _require_session() -> AuthSession:
+    """Get valid session or exit.
+
+    Cached so the session is loaded and validated against ServiceNow at
+    most once per process.
+    """
+    session = AuthSession.load()
+    if session is None:
+        console.print("[yellow]No session found. Run 'login' first.[/yellow]")
+        raise typer.Exit(1)
+
+    if not OktaAuthenticator.validate_session(session):
+        console.print("[yellow]Session expired. Run 'login' to re-authenticate.[/yellow]")
+        raise typer.Exit(1)
+
+    return session
+
+
+def require_auth(fn):
+    """Decorator: call the command with a validated session as its first argument.
+
+    The session parameter is hidden from typer, so it never becomes a CLI
+    option. Validation goes through the cached _require_session.
+    """
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return fn(_require_session(), *args, **kwargs)
+
+    wrapper.__signature__ = signature.replace(parameters=list(signature.parameters.values())[1:])
+    return wrapper
+
+
 SOURCE_HELP = """Filter by source:
 docs=documentation, kb=knowledge base, defect=bugs,
 release=releases, idea=feature requests, community=forums"""
@@ -118,14 +194,23 @@ def find(
 
         ellucian-support find "guide" --type pdf
     """
-    session = AuthSession.load()
-    if session is None:
-        console.print("[yellow]No session found. Run 'login' first.[/yellow]")
-        raise typer.Exit(1)
+    from .search import VALID_FILETYPES, VALID_SOURCES, SearchError, search
+
+    # Reject unknown filters up front rather than silently searching unfiltered
+    bad_sources = [s for s in source if s not in VALID_SOURCES]
+    if bad_sources:
+        raise typer.BadParameter(
+            f"{', '.join(bad_sources)} (choose from {', '.join(sorted(VALID_SOURCES))})",
+            param_hint="'--source'",
+        )
+    bad_types = [t for t in filetype if t not in VALID_FILETYPES]
+    if bad_types:
+        raise typer.BadParameter(
+            f"{', '.join(bad_types)} (choose from {', '.join(sorted(VALID_FILETYPES))})",
+            param_hint="'--type'",
+        )
 
-    if not OktaAuthenticator.validate_session(session):
-        console.print("[yellow]Session expired. Run 'login' to re-authenticate.[/yellow]")
-        raise typer.Exit(1)
+    session = _require_session()
 
     # Convert filter lists (empty list means no filter)
     source_filter = source if source else None
@@ -144,8 +229,6 @@ def find(
         raise typer.Exit(1)
 
     if json_output:
-        import json
-
         output = {
             "query": results.query,
             "total_count": results.total_count,
@@ -160,20 +243,18 @@ def find(
                 for r in results.results
             ],
         }
-        console.print(json.dumps(output, indent=2))
+        _print_json(output)
     else:
         console.print(f"\n[bold]Results for:[/bold] {query}")
         console.print(f"[dim]Found {results.total_count} total ({results.duration_ms}ms)[/dim]\n")
 
-        table = Table(show_header=True, header_style="bold")
+        table = _table(show_header=True, header_style="bold")
         table.add_column("#", style="dim", width=3)
         table.add_column("Title", width=50)
         table.add_column("Type", width=8)
 
         for i, r in enumerate(results.results, 1):
-            # Truncate title if too long
-            title = r.title[:47] + "..." if len(r.title) > 50 else r.title
-            table.add_row(str(i), title, r.source)
+            table.add_row(str(i), _trunc(r.title, 50), r.source)
 
         console.print(table)
 
@@ -184,7 +265,9 @@ def find(
 
 
 @app.command()
+@require_auth
 def fetch(
+    session: AuthSession,
     url: str = typer.Argument(..., help="Article URL or sys_id"),
     attachments: bool = typer.Option(False, "--attachments", "-a", help="List attachments"),
     json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
@@ -199,14 +282,7 @@ def fetch(
 
         ellucian-support fetch abc123... --attachments
     """
-    session = AuthSession.load()
-    if session is None:
-        console.print("[yellow]No session found. Run 'login' first.[/yellow]")
-        raise typer.Exit(1)
-
-    if not OktaAuthenticator.validate_session(session):
-        console.print("[yellow]Session expired. Run 'login' to re-authenticate.[/yellow]")
-        raise typer.Exit(1)
+    from .fetch import FetchError, fetch_attachments, fetch_kb_article
 
     try:
         article = fetch_kb_article(session, url)
@@ -215,8 +291,6 @@ def fetch(
         raise typer.Exit(1)
 
     if json_output:
-        import json
-
         output = {
             "sys_id": article.sys_id,
             "number": article.number,
@@ -236,7 +310,7 @@ def fetch(
                 }
                 for a in att_list
             ]
-        console.print(json.dumps(output, indent=2))
+        _print_json(output)
     else:
         console.print(f"\n[bold]{article.title}[/bold]")
         console.print(f"[dim]Ellucian Article {article.number} | Published: {article.published}[/dim]\n")
@@ -247,16 +321,16 @@ def fetch(
             att_list = fetch_attachments(session, article.sys_id)
             if att_list:
                 console.print(f"\n[bold]Attachments ({len(att_list)}):[/bold]")
-                for a in att_list:
-                    size = int(a.get("size_bytes", 0))
-                    size_str = f"{size / 1024:.1f} KB" if size > 1024 else f"{size} B"
-                    console.print(f"  - {a.get('file_name')} ({size_str})")
+                lines = [f"  - {a.get('file_name')} ({_format_size(int(a.get('size_bytes', 0)))})" for a in att_list]
+                console.print("\n".join(lines))
             else:
                 console.print("\n[dim]No attachments[/dim]")
 
 
 @app.command()
+@require_auth
 def ticket(
+    session: AuthSession,
     number: str = typer.Argument(..., help="Case number"),
     comments: bool = typer.Option(False, "--comments", "-c", help="Show comments"),
     json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
@@ -269,14 +343,7 @@ def ticket(
 
         ellucian-support ticket CSC03683039 --comments
     """
-    session = AuthSession.load()
-    if session is None:
-        console.print("[yellow]No session found. Run 'login' first.[/yellow]")
-        raise typer.Exit(1)
-
-    if not OktaAuthenticator.validate_session(session):
-        console.print("[yellow]Session expired. Run 'login' to re-authenticate.[/yellow]")
-        raise typer.Exit(1)
+    from .ticket import TicketError, get_comments, get_ticket
 
     try:
         t = get_ticket(session, number)
@@ -285,8 +352,6 @@ def ticket(
         raise typer.Exit(1)
 
     if json_output:
-        import json
-
         output = {
             "number": t.number,
             "short_description": t.short_description,
@@ -308,7 +373,7 @@ def ticket(
                 }
                 for c in comment_list
             ]
-        console.print(json.dumps(output, indent=2))
+        _print_json(output)
     else:
         console.print(f"\n[bold]{t.number}[/bold]: {t.short_description}")
         console.print(f"[dim]State: {t.state} | Priority: {t.priority}[/dim]")
@@ -330,7 +395,9 @@ def ticket(
 
 
 @app.command()
+@require_auth
 def tickets(
+    session: AuthSession,
     limit: int = typer.Option(10, "--limit", "-n", help="Number of tickets"),
     json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
 ):
@@ -342,14 +409,7 @@ def tickets(
 
         ellucian-support tickets -n 20
     """
-    session = AuthSession.load()
-    if session is None:
-        console.print("[yellow]No session found. Run 'login' first.[/yellow]")
-        raise typer.Exit(1)
-
-    if not OktaAuthenticator.validate_session(session):
-        console.print("[yellow]Session expired. Run 'login' to re-authenticate.[/yellow]")
-        raise typer.Exit(1)
+    from .ticket import TicketError, list_tickets
 
     try:
         ticket_list = list_tickets(session, limit=limit)
@@ -358,8 +418,6 @@ def tickets(
         raise typer.Exit(1)
 
     if json_output:
-        import json
-
         output = [
             {
                 "number": t.number,
@@ -369,24 +427,25 @@ def tickets(
             }
             for t in ticket_list
         ]
-        console.print(json.dumps(output, indent=2))
+        _print_json(output)
     else:
         console.print(f"\n[bold]Recent Tickets ({len(ticket_list)})[/bold]\n")
 
-        table = Table(show_header=True, header_style="bold")
+        table = _table(show_header=True, header_style="bold")
         table.add_column("Number", width=14)
         table.add_column("Description", width=45)
         table.add_column("State", width=10)
 
         for t in ticket_list:
-            desc = t.short_description[:42] + "..." if len(t.short_description) > 45 else t.short_description
-            table.add_row(t.number, desc, t.state)
+            table.add_row(t.number, _trunc(t.short_description, 45), t.state)
 
         console.print(table)
 
 
 @app.command()
+@require_auth
 def comment(
+    session: AuthSession,
     number: str = typer.Argument(..., help="Case number"),
     message: str = typer.Argument(..., help="Comment text"),
 ):
@@ -396,14 +455,7 @@ def comment(
 
         ellucian-support comment CSC03683039 "Following up on this issue"
     """
-    session = AuthSession.load()
-    if session is None:
-        console.print("[yellow]No session found. Run 'login' first.[/yellow]")
-        raise typer.Exit(1)
-
-    if not OktaAuthenticator.validate_session(session):
-        console.print("[yellow]Session expired. Run 'login' to re-authenticate.[/yellow]")
-        raise typer.Exit(1)
+    from .ticket import TicketError, add_comment, get_ticket
 
     # First get the ticket to get its sys_id
     try:
@@ -425,22 +477,10 @@ download_app = typer.Typer(help="Download Center (FlexNet) commands")
 app.add_typer(download_app, name="download")
 
 
-def _require_session() -> AuthSession:
-    """Get valid session or exit."""
-    session = AuthSession.load()
-    if session is None:
-        console.print("[yellow]No session found. Run 'login' first.[/yellow]")
-        raise typer.Exit(1)
-
-    if not OktaAuthenticator.validate_session(session):
-        console.print("[yellow]Session expired. Run 'login' to re-authenticate.[/yellow]")
-        raise typer.Exit(1)
-
-    return session
-
-
 @download_app.command("products")
+@require_auth
 def download_products(
+    session: AuthSession,
     query: str = typer.Option("", "--query", "-q", help="Filter products by name"),
     json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
 ):
@@ -454,7 +494,7 @@ def download_products(
 
         ellucian-support download products -q identity --json
     """
-    session = _require_session()
+    from .download import DownloadCenterError, FlexNetClient
 
     try:
         with FlexNetClient(session, progress_callback=lambda m: console.print(f"[dim]{m}[/dim]")) as client:
@@ -467,17 +507,15 @@ def download_products(
         raise typer.Exit(1)
 
     if json_output:
-        import json
-
         output = [{"line_id": lid, "name": name} for lid, name in products]
-        console.print(json.dumps(output, indent=2))
+        _print_json(output)
     else:
         if query:
             console.print(f"\n[bold]Products matching '{query}' ({len(products)})[/bold]\n")
         else:
             console.print(f"\n[bold]Available Products ({len(products)})[/bold]\n")
 
-        table = Table(show_header=True, header_style="bold")
+        table = _table(show_header=True, header_style="bold")
         table.add_column("#", style="dim", width=4)
         table.add_column("Product", width=60)
         table.add_column("Line ID", width=40)
@@ -489,7 +527,9 @@ def download_products(
 
 
 @download_app.command("files")
+@require_auth
 def download_files(
+    session: AuthSession,
     product: str = typer.Argument(..., help="Product line ID or package ID"),
     pattern: str = typer.Option("", "--pattern", "-p", help="Filter files by pattern"),
     json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
@@ -504,7 +544,7 @@ def download_files(
 
         ellucian-support download files "Ellucian-Ethos-Identity" --json
     """
-    session = _require_session()
+    from .download import DownloadCenterError, FlexNetClient
 
     try:
         with FlexNetClient(session, progress_callback=lambda m: console.print(f"[dim]{m}[/dim]")) as client:
@@ -520,8 +560,6 @@ def download_files(
         raise typer.Exit(1)
 
     if json_output:
-        import json
-
         output = [
             {
                 "name": f.name,
@@ -530,14 +568,14 @@ def download_files(
             }
             for f in files
         ]
-        console.print(json.dumps(output, indent=2))
+        _print_json(output)
     else:
         console.print(f"\n[bold]Files for {product}[/bold]")
         if pattern:
             console.print(f"[dim]Filtered by: {pattern}[/dim]")
         console.print(f"[dim]Found {len(files)} files[/dim]\n")
 
-        table = Table(show_header=True, header_style="bold")
+        table = _table(show_header=True, header_style="bold")
         table.add_column("#", style="dim", width=4)
         table.add_column("File Name", width=55)
         table.add_column("Size", width=12)
@@ -548,12 +586,21 @@ def download_files(
         console.print(table)
 
 
+def _update_download_progress(progress, task, downloaded: int, total: int) -> None:
+    """Progress callback for FlexNetClient.download_file (bound per file with partial)."""
+    if total > 0:
+        progress.update(task, total=total, completed=downloaded)
+
+
 @download_app.command("get")
+@require_auth
 def download_get(
+    session: AuthSession,
     product: str = typer.Argument(..., help="Product line ID or package ID"),
     pattern: str = typer.Option("", "--pattern", "-p", help="Download files matching pattern"),
     output_dir: Path = typer.Option(Path("."), "--output", "-o", help="Output directory"),
     dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Show what would be downloaded"),
+    parallel: int = typer.Option(4, "--parallel", "-P", min=1, help="Number of concurrent downloads"),
 ):
     """Download files from the Download Center.
 
@@ -564,8 +611,10 @@ def download_get(
         ellucian-support download get "Ellucian-Ethos-Identity" -p "baseline-5.10.0" -n
 
         ellucian-support download get "Ellucian - Ellucian Ethos Identity" -p ".zip"
+
+        ellucian-support download get "Ellucian-Ethos-Identity" -p ".zip" -P 1
     """
-    session = _require_session()
+    from .download import DownloadCenterError, FlexNetClient
 
     try:
         with FlexNetClient(session, progress_callback=lambda m: console.print(f"[dim]{m}[/dim]")) as client:
@@ -590,6 +639,8 @@ def download_get(
 
             console.print(f"\nDownloading to: {output_dir.absolute()}")
 
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+
             from rich.progress import BarColumn, DownloadColumn, Progress, SpinnerColumn, TextColumn
 
             with Progress(
@@ -597,18 +648,24 @@ def download_get(
                 TextColumn("[progress.description]{task.description}"),
                 BarColumn(),
                 DownloadColumn(),
-                console=console,
+                console=_rich_console(),
             ) as progress:
-                for f in files:
-                    task = progress.add_task(f.name[:40], total=None)
-
-                    def update_progress(downloaded: int, total: int):
-                        if total > 0:
-                            progress.update(task, total=total, completed=downloaded)
 
+                def download_one(f, task):
+                    update_progress = functools.partial(_update_download_progress, progress, task)
                     client.download_file(f, output_dir, progress_callback=update_progress)
                     progress.update(task, description=f"[green]✓[/green] {f.name[:40]}")
 
+                # One progress row per file up front; transfers overlap on the
+                # shared (already authenticated) FlexNet client.
+                with ThreadPoolExecutor(max_workers=parallel) as executor:
+                    futures = [
+                        executor.submit(download_one, f, progress.add_task(f.name[:40], total=None))
+                        for f in files
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
+
             console.print(f"\n[green]✓ Downloaded {len(files)} files to {output_dir}[/green]")
 
     except DownloadCenterError as e:
@@ -621,6 +678,12 @@ releases_app = typer.Typer(help="Product release commands")
 app.add_typer(releases_app, name="releases")
 
 
+def _check_catalog_query(query: str, num: int) -> None:
+    """Refuse an unqualified catalog dump before any request is made."""
+    if not query and num > 50:
+        raise typer.BadParameter("Specify a query or --num <= 50", param_hint="'--num'")
+
+
 @releases_app.command("search")
 def releases_search(
     query: str = typer.Argument("", help="Search query (e.g., 'Banner Financial Aid')"),
@@ -637,6 +700,9 @@ def releases_search(
 
         ellucian-support releases search --json
     """
+    from .release import ReleaseError, search_releases
+
+    _check_catalog_query(query, num)
     session = _require_session()
 
     try:
@@ -646,24 +712,22 @@ def releases_search(
         raise typer.Exit(1)
 
     if json_output:
-        import json
-
         output = [r.to_dict() for r in releases]
-        console.print(json.dumps(output, indent=2))
+        _print_json(output)
     else:
         console.print(f"\n[bold]Releases[/bold]")
         if query:
             console.print(f"[dim]Query: {query}[/dim]")
         console.print(f"[dim]Found {len(releases)} results[/dim]\n")
 
-        table = Table(show_header=True, header_style="bold")
+        table = _table(show_header=True, header_style="bold")
         table.add_column("#", style="dim", width=3)
         table.add_column("Number", width=12)
         table.add_column("Description", width=40)
         table.add_column("Date", width=12)
 
         for i, r in enumerate(releases, 1):
-            desc = r.short_description[:37] + "..." if len(r.short_description) > 40 else r.short_description
+            desc = _trunc(r.short_description, 40)
             table.add_row(str(i), r.number, desc, r.date_released[:10] if r.date_released else "")
 
         console.print(table)
@@ -675,7 +739,9 @@ def releases_search(
 
 
 @releases_app.command("show")
+@require_auth
 def releases_show(
+    session: AuthSession,
     sys_id: str = typer.Argument(..., help="Release sys_id"),
     with_defects: bool = typer.Option(False, "--defects", "-d", help="Include related defects"),
     with_enhancements: bool = typer.Option(False, "--enhancements", "-e", help="Include related enhancements"),
@@ -692,7 +758,7 @@ def releases_show(
 
         ellucian-support releases show 45cce3d2... --full --json
     """
-    session = _require_session()
+    from .release import ReleaseError, get_release, get_release_with_details
 
     try:
         if full or with_defects or with_enhancements:
@@ -710,9 +776,7 @@ def releases_show(
         raise typer.Exit(1)
 
     if json_output:
-        import json
-
-        console.print(json.dumps(release.to_dict(), indent=2))
+        _print_json(release.to_dict())
     else:
         console.print(f"\n[bold]{release.short_description}[/bold]")
         console.print(f"[dim]Number: {release.number} | Released: {release.date_released}[/dim]")
@@ -723,25 +787,23 @@ def releases_show(
 
         if release.defects:
             console.print(f"\n[bold]Related Defects ({len(release.defects)})[/bold]")
-            table = Table(show_header=True, header_style="bold")
+            table = _table(show_header=True, header_style="bold")
             table.add_column("Number", width=12)
             table.add_column("Summary", width=60)
 
             for d in release.defects:
-                summary = d.summary[:57] + "..." if len(d.summary) > 60 else d.summary
-                table.add_row(d.number, summary)
+                table.add_row(d.number, _trunc(d.summary, 60))
 
             console.print(table)
 
         if release.enhancements:
             console.print(f"\n[bold]Related Enhancements ({len(release.enhancements)})[/bold]")
-            table = Table(show_header=True, header_style="bold")
+            table = _table(show_header=True, header_style="bold")
             table.add_column("Number", width=12)
             table.add_column("Summary", width=60)
 
             for e in release.enhancements:
-                summary = e.summary[:57] + "..." if len(e.summary) > 60 else e.summary
-                table.add_row(e.number, summary)
+                table.add_row(e.number, _trunc(e.summary, 60))
 
             console.print(table)
 
@@ -764,36 +826,42 @@ def releases_export(
 
         ellucian-support releases export "Financial Aid" --enrich -o enriched.json
     """
+    from .release import ReleaseError, enrich_release, search_releases
+
+    _check_catalog_query(query, num)
     session = _require_session()
 
     try:
         releases = search_releases(session, query, num_results=num)
 
         if enrich:
-            console.print(f"[dim]Enriching {len(releases)} releases with defects/enhancements...[/dim]")
-            for i, r in enumerate(releases, 1):
-                console.print(f"[dim]  ({i}/{len(releases)}) {r.number}...[/dim]")
-                enrich_release(session, r)
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+
+            total = len(releases)
+            console.print(f"[dim]Enriching {total} releases with defects/enhancements...[/dim]")
+            # Each enrich_release call is a handful of blocking HTTP requests
+            # with its own client, so they overlap cleanly on threads.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {executor.submit(enrich_release, session, r): r for r in releases}
+                for i, future in enumerate(as_completed(futures), 1):
+                    future.result()
+                    console.print(f"[dim]  ({i}/{total}) {futures[future].number}[/dim]")
 
     except ReleaseError as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
-    import json
-
     data = {
         "query": query,
         "count": len(releases),
         "releases": [r.to_dict() for r in releases],
     }
 
-    json_str = json.dumps(data, indent=2)
-
     if output:
-        output.write_text(json_str)
+        output.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         console.print(f"[green]Exported {len(releases)} releases to {output}[/green]")
     else:
-        console.print(json_str)
+        _print_json(data)
 
 
 # Upgrade documentation commands
@@ -802,13 +870,16 @@ app.add_typer(upgrades_app, name="upgrades")
 
 
 @upgrades_app.command("gather")
+@require_auth
 def upgrades_gather(
+    session: AuthSession,
     title: str = typer.Argument(..., help="Upgrade round title (e.g., 'Spring 2026')"),
     cutoff: str = typer.Option(..., "--cutoff", "-c", help="Cutoff date (YYYY-MM-DD)"),
     since: str = typer.Option("", "--since", "-s", help="Since date for recent releases"),
     enrich: bool = typer.Option(True, help="Fetch defects/enhancements/prerequisites"),
     output: Path = typer.Option(None, "--output", "-o", help="Output file (default: stdout)"),
     json_output: bool = typer.Option(True, "--json/--no-json", help="JSON output"),
+    concurrency: int = typer.Option(8, "--concurrency", "-P", min=1, help="Enrichment requests in parallel"),
 ):
     """Gather release data for an upgrade round.
 
@@ -824,8 +895,6 @@ def upgrades_gather(
     """
     from .upgrade import gather_upgrade_round
 
-    session = _require_session()
-
     try:
         round_ = gather_upgrade_round(
             session,
@@ -834,21 +903,21 @@ def upgrades_gather(
             since_date=since,
             enrich=enrich,
             progress_callback=lambda msg: console.print(f"[dim]{msg}[/dim]"),
+            concurrency=concurrency,
         )
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
-    json_str = round_.to_json()
-
     if output:
-        output.write_text(json_str)
+        with output.open("w") as f:
+            round_.write_json(f)
         console.print(
             f"[green]Gathered {sum(len(m.releases) for m in round_.modules)} releases "
             f"in {len(round_.modules)} modules → {output}[/green]"
         )
     else:
-        console.print(json_str)
+        console.print(round_.to_json())
 
 
 @upgrades_app.command("preview")
@@ -874,7 +943,7 @@ def upgrades_preview(
     console.print(f"[dim]Cutoff: {round_.cutoff_date} | Since: {round_.since_date or 'N/A'}[/dim]")
     console.print(f"[dim]Modules: {len(round_.modules)} | Total releases: {sum(len(m.releases) for m in round_.modules)}[/dim]\n")
 
-    table = Table(show_header=True, header_style="bold")
+    table = _table(show_header=True, header_style="bold")
     table.add_column("#", style="dim", width=3)
     table.add_column("Module", width=30)
     table.add_column("Versions", width=25)
@@ -908,6 +977,7 @@ def upgrades_publish(
     space_id: str = typer.Option(..., "--space-id", help="Confluence space ID"),
     parent_id: str = typer.Option(..., "--parent-id", help="Parent page/folder ID"),
     dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Generate HTML without creating pages"),
+    concurrency: int = typer.Option(8, "--concurrency", "-P", min=1, help="Detail pages created in parallel"),
 ):
     """Publish upgrade round to Confluence.
 
@@ -955,6 +1025,7 @@ def upgrades_publish(
             site=site,
             dry_run=dry_run,
             progress_callback=lambda msg: console.print(f"[dim]{msg}[/dim]"),
+            concurrency=concurrency,
         )
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
@@ -1062,8 +1133,8 @@ def upgrades_client_publish(
     """
     import json as json_mod
 
+    from .confluence import confluence_client, render_client_page
     from .confluence import create_page as conf_create_page
-    from .confluence import render_client_page
     from .upgrade import UpgradeRound, match_installed_versions
 
     load_env()
@@ -1112,120 +1183,117 @@ def upgrades_client_publish(
         console.print("[yellow]No ESM products matched any modules in the upgrade round[/yellow]")
         raise typer.Exit(0)
 
-    # Fetch baseline detail links if baseline page ID provided
-    detail_links: dict[str, str] = {}
-    if baseline_page_id and not dry_run and all([user, token, site]):
-        console.print(f"[dim]Fetching baseline detail page links from {baseline_page_id}...[/dim]")
+    # One Confluence connection for the baseline link crawl and the page create
+    with contextlib.nullcontext() if dry_run else confluence_client(user, token) as conf_client:
+        # Fetch baseline detail links if baseline page ID provided
+        detail_links: dict[str, str] = {}
+        if baseline_page_id and conf_client is not None:
+            console.print(f"[dim]Fetching baseline detail page links from {baseline_page_id}...[/dim]")
+            try:
+                detail_links = _fetch_baseline_detail_links(baseline_page_id, site, conf_client)
+                console.print(f"[dim]Found {len(detail_links)} detail page links[/dim]")
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not fetch baseline links: {e}[/yellow]")
+
+        # Render the client page
+        title = f"{client_name} {round_.title}"
+        body = render_client_page(round_, installed, detail_links, client_name=client_name)
+
+        console.print(f"\n[bold]Publishing: {title}[/bold]")
+        console.print(f"[dim]Modules: {len(installed)} | Space: {space_id} | Parent: {parent_id}[/dim]")
+
+        if dry_run:
+            console.print("[yellow]DRY RUN — no pages will be created[/yellow]")
+            outfile = input_file.with_suffix(f".{client_name.lower()}.html")
+            outfile.write_text(body)
+            console.print(f"[green]Client page HTML → {outfile}[/green]")
+
+            # Also show which modules matched
+            console.print(f"\n[bold]Installed modules ({len(installed)}):[/bold]")
+            rows = sorted(installed.items(), key=lambda kv: kv[0].casefold())
+            console.print("\n".join(f"  {mod_name}: {ver}" for mod_name, ver in rows))
+            return
+
+        # Create the page
         try:
-            detail_links = _fetch_baseline_detail_links(
-                baseline_page_id, user, token, site,
+            result = conf_create_page(
+                title, space_id, parent_id, body,
+                user, token, site, client=conf_client,
             )
-            console.print(f"[dim]Found {len(detail_links)} detail page links[/dim]")
+            page_url = result.get("_links", {}).get("tinyui", "")
+            if page_url and not page_url.startswith("http"):
+                page_url = f"https://{site}/wiki{page_url}"
+            console.print(f"\n[green]Created: {title}[/green]")
+            console.print(f"[green]URL: {page_url}[/green]")
+            console.print(f"[green]ID: {result.get('id', '')}[/green]")
         except Exception as e:
-            console.print(f"[yellow]Warning: Could not fetch baseline links: {e}[/yellow]")
-
-    # Render the client page
-    title = f"{client_name} {round_.title}"
-    body = render_client_page(round_, installed, detail_links, client_name=client_name)
-
-    console.print(f"\n[bold]Publishing: {title}[/bold]")
-    console.print(f"[dim]Modules: {len(installed)} | Space: {space_id} | Parent: {parent_id}[/dim]")
-
-    if dry_run:
-        console.print("[yellow]DRY RUN — no pages will be created[/yellow]")
-        outfile = input_file.with_suffix(f".{client_name.lower()}.html")
-        outfile.write_text(body)
-        console.print(f"[green]Client page HTML → {outfile}[/green]")
-
-        # Also show which modules matched
-        console.print(f"\n[bold]Installed modules ({len(installed)}):[/bold]")
-        for mod_name, ver in sorted(installed.items()):
-            console.print(f"  {mod_name}: {ver}")
-        return
-
-    # Create the page
-    try:
-        result = conf_create_page(
-            title, space_id, parent_id, body,
-            user, token, site,
-        )
-        page_url = result.get("_links", {}).get("tinyui", "")
-        if page_url and not page_url.startswith("http"):
-            page_url = f"https://{site}/wiki{page_url}"
-        console.print(f"\n[green]Created: {title}[/green]")
-        console.print(f"[green]URL: {page_url}[/green]")
-        console.print(f"[green]ID: {result.get('id', '')}[/green]")
-    except Exception as e:
-        console.print(f"[red]Error creating page:[/red] {e}")
-        raise typer.Exit(1)
+            console.print(f"[red]Error creating page:[/red] {e}")
+            raise typer.Exit(1)
 
 
 def _fetch_baseline_detail_links(
     baseline_page_id: str,
-    user: str,
-    token: str,
     site: str,
+    client: "httpx.Client",
 ) -> dict[str, str]:
     """Fetch detail page links from the baseline root page's children.
 
     Paginates through children and fetches each page individually to get
     tinyui links (the children list endpoint doesn't include _links).
 
+    Args:
+        baseline_page_id: Confluence page ID of the baseline root page.
+        site: Atlassian site.
+        client: Authenticated client from confluence.confluence_client().
+
     Returns a dict of module_name -> page URL for linking from client pages.
     """
-    import base64
-
     from .upgrade import parse_module_name
 
-    credentials = base64.b64encode(f"{user}:{token}".encode()).decode()
-    headers = {
-        "Authorization": f"Basic {credentials}",
-        "Accept": "application/json",
-    }
-
     # Step 1: Collect all child page IDs and titles (with pagination)
     children = []
     url = f"https://{site}/wiki/api/v2/pages/{baseline_page_id}/children"
     params = {"limit": 100}
 
-    with httpx.Client(timeout=60.0) as client:
-        while url:
-            resp = client.get(url, headers=headers, params=params)
-            if resp.status_code != 200:
-                break
-            data = resp.json()
-            children.extend(data.get("results", []))
-            # Follow pagination cursor
-            next_link = data.get("_links", {}).get("next", "")
-            if next_link:
-                url = f"https://{site}/wiki{next_link}" if not next_link.startswith("http") else next_link
-                params = {}  # cursor is embedded in the next URL
-            else:
-                url = None
-
-        # Step 2: Fetch tinyui for each child page
-        detail_links = {}
-        for child in children:
-            page_id = child.get("id", "")
-            title = child.get("title", "")
-            # Detail page titles may have slash-separated versions (e.g.
-            # "BA FIN AID 8.55 - REPOST/9.3.56.1/8.56"). Split on first
-            # slash before parsing so the module name extracts cleanly.
-            base_title = title.split("/")[0] if "/" in title else title
-            module_name = parse_module_name(base_title)
-            if not module_name or not page_id:
-                continue
-
-            page_url = f"https://{site}/wiki/api/v2/pages/{page_id}"
-            resp = client.get(page_url, headers=headers)
-            if resp.status_code == 200:
-                page_data = resp.json()
-                tinyui = page_data.get("_links", {}).get("tinyui", "")
-                if tinyui and not tinyui.startswith("http"):
-                    base = page_data.get("_links", {}).get("base", f"https://{site}/wiki")
-                    tinyui = f"{base}{tinyui}"
-                if tinyui:
-                    detail_links[module_name] = tinyui
+    while url:
+        resp = client.get(url, params=params)
+        if resp.status_code != 200:
+            break
+        data = resp.json()
+        results = data.get("results")
+        if results:
+            children += results
+        # Follow pagination cursor
+        next_link = data.get("_links", {}).get("next", "")
+        if next_link:
+            url = f"https://{site}/wiki{next_link}" if not next_link.startswith("http") else next_link
+            params = {}  # cursor is embedded in the next URL
+        else:
+            url = None
+
+    # Step 2: Fetch tinyui for each child page
+    detail_links = {}
+    for child in children:
+        page_id = child.get("id", "")
+        title = child.get("title", "")
+        # Detail page titles may have slash-separated versions (e.g.
+        # "BA FIN AID 8.55 - REPOST/9.3.56.1/8.56"). Split on first
+        # slash before parsing so the module name extracts cleanly.
+        base_title = title.split("/")[0] if "/" in title else title
+        module_name = parse_module_name(base_title)
+        if not module_name or not page_id:
+            continue
+
+        page_url = f"https://{site}/wiki/api/v2/pages/{page_id}"
+        resp = client.get(page_url)
+        if resp.status_code == 200:
+            page_data = resp.json()
+            tinyui = page_data.get("_links", {}).get("tinyui", "")
+            if tinyui and not tinyui.startswith("http"):
+                base = page_data.get("_links", {}).get("base", f"https://{site}/wiki")
+                tinyui = f"{base}{tinyui}"
+            if tinyui:
+                detail_links[module_name] = tinyui
 
     return detail_links
 
@@ -4,16 +4,38 @@ Generates Confluence storage format XML matching the existing baseline
 page structure, and provides create/update via the REST API v2.
 """
 
+import base64
+import contextlib
+import functools
+import importlib.util
+import math
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from html import escape
-from typing import Any
+from operator import attrgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
-import httpx
+import orjson
 
-from .release import Defect, Enhancement, Release
+from .release import Release
 from .upgrade import UpgradeModule, UpgradeRound, parse_module_name
 
+if TYPE_CHECKING:
+    import httpx
+
 SERVICENOW_BASE = "https://elluciansupport.service-now.com"
 
+# Detail pages are independent siblings, so by default they are created this many at a time
+_PUBLISH_WORKERS = 8
+
+# Rate limiting and transient gateway errors are retried with backoff
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_MAX_RETRIES = 4
+_MAX_RETRY_DELAY = 60.0
+
 
 class ConfluenceError(Exception):
     """Confluence API operation failed."""
@@ -30,14 +52,20 @@ _BOILERPLATE_PHRASES = [
     "This release includes changes to improve product quality",
 ]
 
+# All phrases as one alternation so each description is scanned once
+_BOILERPLATE_RE = re.compile("|".join(map(re.escape, _BOILERPLATE_PHRASES)))
+
 
 def _is_boilerplate(text: str) -> bool:
     """Check if text is generic boilerplate that adds no value."""
-    return any(phrase in text for phrase in _BOILERPLATE_PHRASES)
+    return _BOILERPLATE_RE.search(text) is not None
 
 
 def _release_type_label(release: Release) -> str:
-    """Determine the Defect/Enhancement/Regulatory label for a release."""
+    """Determine the Defect/Enhancement/Regulatory label for a release.
+
+    The label only ever combines fixed words with "/", so it never needs escaping.
+    """
     parts = []
     if release.defects:
         parts.append("Defect")
@@ -48,6 +76,7 @@ def _release_type_label(release: Release) -> str:
     return "/".join(parts)
 
 
+@functools.lru_cache(maxsize=4096)
 def _version_from_short_desc(short_description: str) -> str:
     """Extract version from short_description (the part after module name)."""
     module = parse_module_name(short_description)
@@ -55,6 +84,13 @@ def _version_from_short_desc(short_description: str) -> str:
     return version or short_description
 
 
+@functools.lru_cache(maxsize=4096)
+def _escaped_version(short_description: str) -> str:
+    """HTML-escaped version for a short_description, shared by every page that shows it."""
+    return escape(_version_from_short_desc(short_description))
+
+
+@functools.lru_cache(maxsize=1024)
 def _format_date(date_str: str) -> str:
     """Format a date string for the Details table (MM-DD)."""
     if not date_str:
@@ -66,13 +102,26 @@ def _format_date(date_str: str) -> str:
     return date_str
 
 
+@functools.lru_cache(maxsize=1024)
+def _date_text(date_str: str) -> str:
+    """HTML-escaped Details table date (MM-DD) for a raw release date."""
+    return escape(_format_date(date_str))
+
+
 def _dependencies_html(prerequisites: list[str]) -> str:
     """Render prerequisite list as <p> elements."""
     if not prerequisites:
         return "<p />"
-    return "".join(f"<p>{escape(p)}</p>" for p in prerequisites)
+    return _dependencies_html_cached(tuple(prerequisites))
 
 
+@functools.lru_cache(maxsize=1024)
+def _dependencies_html_cached(prerequisites: tuple[str, ...]) -> str:
+    """Render a non-empty prerequisite tuple; shared prerequisites are escaped once."""
+    return f"<p>{'</p><p>'.join(map(escape, prerequisites))}</p>"
+
+
+@functools.lru_cache(maxsize=4096)
 def _version_cell(version: str, link_url: str = "") -> str:
     """Render a version cell, optionally as a link."""
     v = escape(version)
@@ -81,12 +130,139 @@ def _version_cell(version: str, link_url: str = "") -> str:
     return f"<p>{v}</p>"
 
 
-def render_root_page(round_: UpgradeRound, detail_links: dict[str, str] = None) -> str:
-    """Generate storage format XML for the baseline root page.
+# Static storage-format fragments shared by the page renderers. Only the
+# synopsis text and table rows vary per page, so the skeleton is built once.
+
+_CAMPUS_DETAILS_CELL = (
+    '<ac:layout-cell>'
+    '<p><strong>Campus Details</strong></p>'
+    '<p />'
+    '<ac:structured-macro ac:name="note" ac:schema-version="1">'
+    '<ac:rich-text-body>'
+    '<p><strong>Special Upgrade Instructions</strong></p>'
+    '<p />'
+    '</ac:rich-text-body>'
+    '</ac:structured-macro>'
+    '<p />'
+    '</ac:layout-cell>'
+)
+
+_TIMELINE_HTML = (
+    '<h3>Local Objects Requiring Testing</h3>'
+    '<p />'
+    '<h3>Timeline</h3>'
+    '<table data-table-width="760" data-layout="default">'
+    '<colgroup>'
+    '<col style="width: 152.0px;" />'
+    '<col style="width: 152.0px;" />'
+    '<col style="width: 192.0px;" />'
+    '<col style="width: 138.0px;" />'
+    '<col style="width: 124.0px;" />'
+    '</colgroup>'
+    '<tbody>'
+    '<tr>'
+    '<th><p><strong>Environment</strong></p></th>'
+    '<th><p><strong>Release Date</strong></p></th>'
+    '<th><p><strong>Proposed Dates</strong></p></th>'
+    '<th><p /></th>'
+    '<th><p /></th>'
+    '</tr>'
+    '<tr><td><p>UPGR</p></td><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>'
+    '<tr><td><p>TEST</p></td><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>'
+    '<tr><td><p>PROD</p></td><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>'
+    '<tr><td><p>DEVL</p></td><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>'
+    '</tbody>'
+    '</table>'
+)
+
+# Everything between the synopsis text and the Details rows of a root/client page
+_BASELINE_MIDDLE = (
+    '</ac:layout-cell>'
+    f'{_CAMPUS_DETAILS_CELL}'
+    '</ac:layout-section>'
+    # Full-width body
+    '<ac:layout-section ac:type="fixed-width" ac:breakout-mode="default">'
+    '<ac:layout-cell>'
+    f'{_TIMELINE_HTML}'
+    '<h3>Details</h3>'
+)
+
+_BASELINE_HEAD = (
+    '<ac:layout>'
+    # Two-column header
+    '<ac:layout-section ac:type="two_right_sidebar" ac:breakout-mode="wide" ac:breakout-width="1388">'
+    '<ac:layout-cell>'
+    '<p><strong>Synopsis</strong></p>'
+)
+
+_BASELINE_TAIL = (
+    '</tbody>'
+    '</table>'
+    '<p />'
+    '</ac:layout-cell>'
+    '</ac:layout-section>'
+    '</ac:layout>'
+)
+
+_ROOT_DETAILS_HEAD = (
+    '<table data-table-width="1032" data-layout="center">'
+    '<colgroup>'
+    '<col style="width: 221.0px;" />'
+    '<col style="width: 143.0px;" />'
+    '<col style="width: 137.0px;" />'
+    '<col style="width: 217.0px;" />'
+    '<col style="width: 314.0px;" />'
+    '</colgroup>'
+    '<tbody>'
+    '<tr>'
+    '<th><p><strong>Module</strong></p></th>'
+    '<th><p><strong>Latest Version</strong></p></th>'
+    '<th><p><strong>Release Date</strong></p></th>'
+    '<th><p><strong>Defect/Enhancement/Regulatory</strong></p></th>'
+    '<th><p><strong>Dependencies</strong></p></th>'
+    '</tr>'
+)
+
+_CLIENT_DETAILS_HEAD = (
+    '<table data-table-width="1200" data-layout="center">'
+    '<colgroup>'
+    '<col style="width: 180.0px;" />'
+    '<col style="width: 130.0px;" />'
+    '<col style="width: 130.0px;" />'
+    '<col style="width: 110.0px;" />'
+    '<col style="width: 220.0px;" />'
+    '<col style="width: 230.0px;" />'
+    '</colgroup>'
+    '<tbody>'
+    '<tr>'
+    '<th><p><strong>Module</strong></p></th>'
+    '<th><p><strong>Current Version</strong></p></th>'
+    '<th><p><strong>Latest Version</strong></p></th>'
+    '<th><p><strong>Release Date</strong></p></th>'
+    '<th><p><strong>Defect/Enhancement/Regulatory</strong></p></th>'
+    '<th><p><strong>Dependencies</strong></p></th>'
+    '</tr>'
+)
+
+
+def _render_upgrade_page(
+    round_: UpgradeRound,
+    modules: list[UpgradeModule],
+    *,
+    synopsis_prefix: str,
+    details_head: str,
+    detail_links: dict[str, str] | None,
+    installed_versions: dict[str, str] | None = None,
+) -> str:
+    """Render the layout shared by the baseline root page and client pages.
 
     Args:
         round_: The upgrade round data.
-        detail_links: Optional map of module name -> Confluence page URL (tinyui).
+        modules: Modules to list in the synopsis and Details table.
+        synopsis_prefix: Escaped text leading "upgrade documentation for ...".
+        details_head: Opening markup and header row of the Details table.
+        detail_links: Optional map of module name -> detail page URL.
+        installed_versions: When given, adds a Current Version column (client pages).
 
     Returns:
         Confluence storage format XML string.
@@ -94,109 +270,66 @@ def render_root_page(round_: UpgradeRound, detail_links: dict[str, str] = None)
     if detail_links is None:
         detail_links = {}
 
-    # Build Details table rows
-    detail_rows = []
-    for module in round_.modules:
-        for i, release in enumerate(module.releases):
-            version = _version_from_short_desc(release.short_description)
-            date_str = _format_date(release.target_ga_date or release.date_released)
-            type_label = _release_type_label(release)
-            deps_html = _dependencies_html(release.prerequisites)
-            link = detail_links.get(module.name, "")
-            ver_html = _version_cell(version, link)
-
-            # Module name only on first row of group
-            module_cell = f"<p>{escape(module.name)}</p>" if i == 0 else "<p />"
-
-            detail_rows.append(
-                f"<tr>"
-                f"<td>{module_cell}</td>"
-                f"<td>{ver_html}</td>"
-                f"<td><p>{escape(date_str)}</p></td>"
-                f"<td><p>{escape(type_label)}</p></td>"
-                f"<td>{deps_html}</td>"
-                f"</tr>"
-            )
-
-    details_html = "".join(detail_rows)
-
-    # Module list for synopsis placeholder
-    module_names = ", ".join(m.name for m in round_.modules)
+    # Leading cells of each row; module name (and current version) only on
+    # the first row of each module's group
+    blank_lead = "<p />" if installed_versions is None else "<p /></td><td><p />"
+
+    # Build Details table rows as flat fragments, joined once at the end;
+    # the per-release helpers are bound to locals for the inner loop
+    parts: list[str] = []
+    extend = parts.extend
+    version_of = _version_from_short_desc
+    version_cell = _version_cell
+    date_text = _date_text
+    type_label = _release_type_label
+    dependencies = _dependencies_html
+    for module in modules:
+        lead = f"<p>{module.escaped_name}</p>"
+        if installed_versions is not None:
+            lead += f"</td><td><p>{escape(installed_versions.get(module.name, ''))}</p>"
+        link = detail_links.get(module.name, "")
+        for release in module.releases:
+            extend((
+                "<tr><td>", lead,
+                "</td><td>", version_cell(version_of(release.short_description), link),
+                "</td><td><p>", date_text(release.target_ga_date or release.date_released),
+                "</p></td><td><p>", type_label(release),
+                "</p></td><td>", dependencies(release.prerequisites),
+                "</td></tr>",
+            ))
+            lead = blank_lead
+
+    # Built per render from the modules as they are now, never memoized on the round
+    module_names = ", ".join(map(attrgetter("escaped_name"), modules))
 
     return (
-        '<ac:layout>'
-        # Two-column header
-        '<ac:layout-section ac:type="two_right_sidebar" ac:breakout-mode="wide" ac:breakout-width="1388">'
-        '<ac:layout-cell>'
-        '<p><strong>Synopsis</strong></p>'
-        f'<p>Baseline upgrade documentation for {escape(round_.title)}. '
+        f'{_BASELINE_HEAD}'
+        f'<p>{synopsis_prefix}upgrade documentation for {escape(round_.title)}. '
         f'Cutoff date: {escape(round_.cutoff_date)}.</p>'
-        f'<p>Modules included: {escape(module_names)}</p>'
-        '</ac:layout-cell>'
-        '<ac:layout-cell>'
-        '<p><strong>Campus Details</strong></p>'
-        '<p />'
-        '<ac:structured-macro ac:name="note" ac:schema-version="1">'
-        '<ac:rich-text-body>'
-        '<p><strong>Special Upgrade Instructions</strong></p>'
-        '<p />'
-        '</ac:rich-text-body>'
-        '</ac:structured-macro>'
-        '<p />'
-        '</ac:layout-cell>'
-        '</ac:layout-section>'
-        # Full-width body
-        '<ac:layout-section ac:type="fixed-width" ac:breakout-mode="default">'
-        '<ac:layout-cell>'
-        '<h3>Local Objects Requiring Testing</h3>'
-        '<p />'
-        '<h3>Timeline</h3>'
-        '<table data-table-width="760" data-layout="default">'
-        '<colgroup>'
-        '<col style="width: 152.0px;" />'
-        '<col style="width: 152.0px;" />'
-        '<col style="width: 192.0px;" />'
-        '<col style="width: 138.0px;" />'
-        '<col style="width: 124.0px;" />'
-        '</colgroup>'
-        '<tbody>'
-        '<tr>'
-        '<th><p><strong>Environment</strong></p></th>'
-        '<th><p><strong>Release Date</strong></p></th>'
-        '<th><p><strong>Proposed Dates</strong></p></th>'
-        '<th><p /></th>'
-        '<th><p /></th>'
-        '</tr>'
-        '<tr><td><p>UPGR</p></td><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>'
-        '<tr><td><p>TEST</p></td><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>'
-        '<tr><td><p>PROD</p></td><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>'
-        '<tr><td><p>DEVL</p></td><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>'
-        '</tbody>'
-        '</table>'
-        '<h3>Details</h3>'
-        '<table data-table-width="1032" data-layout="center">'
-        '<colgroup>'
-        '<col style="width: 221.0px;" />'
-        '<col style="width: 143.0px;" />'
-        '<col style="width: 137.0px;" />'
-        '<col style="width: 217.0px;" />'
-        '<col style="width: 314.0px;" />'
-        '</colgroup>'
-        '<tbody>'
-        '<tr>'
-        '<th><p><strong>Module</strong></p></th>'
-        '<th><p><strong>Latest Version</strong></p></th>'
-        '<th><p><strong>Release Date</strong></p></th>'
-        '<th><p><strong>Defect/Enhancement/Regulatory</strong></p></th>'
-        '<th><p><strong>Dependencies</strong></p></th>'
-        '</tr>'
-        f'{details_html}'
-        '</tbody>'
-        '</table>'
-        '<p />'
-        '</ac:layout-cell>'
-        '</ac:layout-section>'
-        '</ac:layout>'
+        f'<p>Modules included: {module_names}</p>'
+        f'{_BASELINE_MIDDLE}'
+        f'{details_head}'
+        f'{"".join(parts)}'
+        f'{_BASELINE_TAIL}'
+    )
+
+
+def render_root_page(round_: UpgradeRound, detail_links: dict[str, str] = None) -> str:
+    """Generate storage format XML for the baseline root page.
+
+    Args:
+        round_: The upgrade round data.
+        detail_links: Optional map of module name -> Confluence page URL (tinyui).
+
+    Returns:
+        Confluence storage format XML string.
+    """
+    return _render_upgrade_page(
+        round_,
+        round_.modules,
+        synopsis_prefix="Baseline ",
+        details_head=_ROOT_DETAILS_HEAD,
+        detail_links=detail_links,
     )
 
 
@@ -224,121 +357,15 @@ def render_client_page(
     Returns:
         Confluence storage format XML string.
     """
-    if detail_links is None:
-        detail_links = {}
-
-    # Filter to only installed modules
-    installed_modules = [m for m in round_.modules if m.name in installed_versions]
-
-    # Build Details table rows
-    detail_rows = []
-    for module in installed_modules:
-        current_ver = installed_versions.get(module.name, "")
-        for i, release in enumerate(module.releases):
-            version = _version_from_short_desc(release.short_description)
-            date_str = _format_date(release.target_ga_date or release.date_released)
-            type_label = _release_type_label(release)
-            deps_html = _dependencies_html(release.prerequisites)
-            link = detail_links.get(module.name, "")
-            ver_html = _version_cell(version, link)
-
-            # Module name and current version only on first row of group
-            module_cell = f"<p>{escape(module.name)}</p>" if i == 0 else "<p />"
-            current_cell = f"<p>{escape(current_ver)}</p>" if i == 0 else "<p />"
-
-            detail_rows.append(
-                f"<tr>"
-                f"<td>{module_cell}</td>"
-                f"<td>{current_cell}</td>"
-                f"<td>{ver_html}</td>"
-                f"<td><p>{escape(date_str)}</p></td>"
-                f"<td><p>{escape(type_label)}</p></td>"
-                f"<td>{deps_html}</td>"
-                f"</tr>"
-            )
-
-    details_html = "".join(detail_rows)
-
-    # Module list for synopsis
-    module_names = ", ".join(m.name for m in installed_modules)
     client_label = f"{client_name} " if client_name else ""
-
-    return (
-        '<ac:layout>'
-        # Two-column header
-        '<ac:layout-section ac:type="two_right_sidebar" ac:breakout-mode="wide" ac:breakout-width="1388">'
-        '<ac:layout-cell>'
-        '<p><strong>Synopsis</strong></p>'
-        f'<p>{escape(client_label)}upgrade documentation for {escape(round_.title)}. '
-        f'Cutoff date: {escape(round_.cutoff_date)}.</p>'
-        f'<p>Modules included: {escape(module_names)}</p>'
-        '</ac:layout-cell>'
-        '<ac:layout-cell>'
-        '<p><strong>Campus Details</strong></p>'
-        '<p />'
-        '<ac:structured-macro ac:name="note" ac:schema-version="1">'
-        '<ac:rich-text-body>'
-        '<p><strong>Special Upgrade Instructions</strong></p>'
-        '<p />'
-        '</ac:rich-text-body>'
-        '</ac:structured-macro>'
-        '<p />'
-        '</ac:layout-cell>'
-        '</ac:layout-section>'
-        # Full-width body
-        '<ac:layout-section ac:type="fixed-width" ac:breakout-mode="default">'
-        '<ac:layout-cell>'
-        '<h3>Local Objects Requiring Testing</h3>'
-        '<p />'
-        '<h3>Timeline</h3>'
-        '<table data-table-width="760" data-layout="default">'
-        '<colgroup>'
-        '<col style="width: 152.0px;" />'
-        '<col style="width: 152.0px;" />'
-        '<col style="width: 192.0px;" />'
-        '<col style="width: 138.0px;" />'
-        '<col style="width: 124.0px;" />'
-        '</colgroup>'
-        '<tbody>'
-        '<tr>'
-        '<th><p><strong>Environment</strong></p></th>'
-        '<th><p><strong>Release Date</strong></p></th>'
-        '<th><p><strong>Proposed Dates</strong></p></th>'
-        '<th><p /></th>'
-        '<th><p /></th>'
-        '</tr>'
-        '<tr><td><p>UPGR</p></td><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>'
-        '<tr><td><p>TEST</p></td><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>'
-        '<tr><td><p>PROD</p></td><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>'
-        '<tr><td><p>DEVL</p></td><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>'
-        '</tbody>'
-        '</table>'
-        '<h3>Details</h3>'
-        '<table data-table-width="1200" data-layout="center">'
-        '<colgroup>'
-        '<col style="width: 180.0px;" />'
-        '<col style="width: 130.0px;" />'
-        '<col style="width: 130.0px;" />'
-        '<col style="width: 110.0px;" />'
-        '<col style="width: 220.0px;" />'
-        '<col style="width: 230.0px;" />'
-        '</colgroup>'
-        '<tbody>'
-        '<tr>'
-        '<th><p><strong>Module</strong></p></th>'
-        '<th><p><strong>Current Version</strong></p></th>'
-        '<th><p><strong>Latest Version</strong></p></th>'
-        '<th><p><strong>Release Date</strong></p></th>'
-        '<th><p><strong>Defect/Enhancement/Regulatory</strong></p></th>'
-        '<th><p><strong>Dependencies</strong></p></th>'
-        '</tr>'
-        f'{details_html}'
-        '</tbody>'
-        '</table>'
-        '<p />'
-        '</ac:layout-cell>'
-        '</ac:layout-section>'
-        '</ac:layout>'
+    return _render_upgrade_page(
+        round_,
+        # Filter to only installed modules
+        [m for m in round_.modules if m.name in installed_versions],
+        synopsis_prefix=escape(client_label),
+        details_head=_CLIENT_DETAILS_HEAD,
+        detail_links=detail_links,
+        installed_versions=installed_versions,
     )
 
 
@@ -368,12 +395,42 @@ def _release_weight(release: Release) -> int:
     return 1
 
 
+def _module_fact(module: UpgradeModule) -> tuple[str, int, str]:
+    """Return (latest_version, max_weight, type_label) for a module with releases."""
+    # The last release is the latest (sorted by date in gather)
+    latest_release = module.releases[-1]
+    return (
+        _version_from_short_desc(latest_release.short_description),
+        # Use the highest weight across all releases for this module
+        max(map(_release_weight, module.releases)),
+        _release_type_label(latest_release),
+    )
+
+
+def precompute_module_facts(round_: UpgradeRound) -> dict[str, tuple[str, int, str]]:
+    """Precompute the per-module facts compute_client_status needs.
+
+    These depend only on the round, so computing them once and passing the
+    result to compute_client_status for every client avoids rescanning each
+    module's releases per client.
+
+    Args:
+        round_: The upgrade round data.
+
+    Returns:
+        Dict of module name -> (latest_version, max_weight, type_label) for
+        every module that has releases.
+    """
+    return {m.name: _module_fact(m) for m in round_.modules if m.releases}
+
+
 def compute_client_status(
     round_: UpgradeRound,
     installed_versions: dict[str, str],
     detail_links: dict[str, str],
     client_page_url: str = "",
     client_name: str = "",
+    module_facts: dict[str, tuple[str, int, str]] | None = None,
 ) -> dict[str, Any]:
     """Compute upgrade status for a single client.
 
@@ -386,6 +443,8 @@ def compute_client_status(
         detail_links: Module name -> baseline detail page URL.
         client_page_url: URL to the client's upgrade page.
         client_name: Display name for the client.
+        module_facts: Optional result of precompute_module_facts(round_),
+            shared across clients; computed per module when omitted.
 
     Returns:
         Dict with color, score, behind_count, modules_behind details.
@@ -397,9 +456,10 @@ def compute_client_status(
     for module in installed_modules:
         if not module.releases:
             continue
-        # The last release is the latest (sorted by date in gather)
-        latest_release = module.releases[-1]
-        latest_version = _version_from_short_desc(latest_release.short_description)
+        if module_facts is not None:
+            latest_version, weight, type_label = module_facts[module.name]
+        else:
+            latest_version, weight, type_label = _module_fact(module)
         current_version = installed_versions.get(module.name, "")
 
         # Simple string comparison — if installed matches latest, they're current.
@@ -408,9 +468,6 @@ def compute_client_status(
         is_behind = current_version != latest_version
 
         if is_behind:
-            # Use the highest weight across all releases for this module
-            weight = max(_release_weight(r) for r in module.releases)
-            type_label = _release_type_label(latest_release)
             modules_behind.append({
                 "name": module.name,
                 "installed": current_version,
@@ -439,6 +496,121 @@ def compute_client_status(
     }
 
 
+_STATUS_TABLE_HEAD = (
+    '<p>Weighted scoring: regulatory releases count 3x, '
+    'security/CVE patches count 2x, maintenance releases count 1x. '
+    'Green ≤ 5, Yellow 6-12, Red 13+.</p>'
+    '<table data-table-width="1200" data-layout="center">'
+    '<colgroup>'
+    '<col style="width: 160.0px;" />'
+    '<col style="width: 120.0px;" />'
+    '<col style="width: 90.0px;" />'
+    '<col style="width: 90.0px;" />'
+    '<col style="width: 110.0px;" />'
+    '<col style="width: 90.0px;" />'
+    '<col style="width: 340.0px;" />'
+    '</colgroup>'
+    '<tbody>'
+    '<tr>'
+    '<th><p><strong>Client</strong></p></th>'
+    '<th><p><strong>Status</strong></p></th>'
+    '<th><p><strong>Modules</strong></p></th>'
+    '<th><p><strong>Behind</strong></p></th>'
+    '<th><p><strong>Up to Date</strong></p></th>'
+    '<th><p><strong>Score</strong></p></th>'
+    '<th><p><strong>Details</strong></p></th>'
+    '</tr>'
+)
+
+_BEHIND_TABLE_HEAD = (
+    '<table data-table-width="760" data-layout="default">'
+    '<colgroup>'
+    '<col style="width: 200.0px;" />'
+    '<col style="width: 140.0px;" />'
+    '<col style="width: 140.0px;" />'
+    '<col style="width: 280.0px;" />'
+    '</colgroup>'
+    '<tbody>'
+    '<tr>'
+    '<th><p><strong>Module</strong></p></th>'
+    '<th><p><strong>Installed</strong></p></th>'
+    '<th><p><strong>Latest</strong></p></th>'
+    '<th><p><strong>Type</strong></p></th>'
+    '</tr>'
+)
+
+
+def compute_client_statuses(
+    round_: UpgradeRound,
+    clients: list[dict[str, Any]],
+    detail_links: dict[str, str],
+) -> list[dict[str, Any]]:
+    """Compute upgrade status for several clients against one round.
+
+    Per-module facts (latest version, weight, type label) are derived once
+    and shared, instead of being recomputed for every client.
+
+    Args:
+        round_: The upgrade round data.
+        clients: Dicts with "installed_versions" and optional "client_name"
+            and "client_page_url" keys.
+        detail_links: Module name -> baseline detail page URL.
+
+    Returns:
+        List of status dicts (see compute_client_status), in client order,
+        ready for render_status_page().
+    """
+    module_facts = precompute_module_facts(round_)
+    return [
+        compute_client_status(
+            round_,
+            client["installed_versions"],
+            detail_links,
+            client_page_url=client.get("client_page_url", ""),
+            client_name=client.get("client_name", ""),
+            module_facts=module_facts,
+        )
+        for client in clients
+    ]
+
+
+_WEIGHT_LABELS = {3: " (regulatory)", 2: " (security)"}
+
+
+def _status_macro(colour: str, title: str) -> str:
+    """Render a Confluence status lozenge."""
+    return (
+        f'<ac:structured-macro ac:name="status" ac:schema-version="1">'
+        f'<ac:parameter ac:name="colour">{colour}</ac:parameter>'
+        f'<ac:parameter ac:name="title">{title}</ac:parameter>'
+        f'</ac:structured-macro>'
+    )
+
+
+# Status lozenge per client color; the markup is constant, so it is built once
+_STATUS_MACROS = MappingProxyType({
+    "green": _status_macro("Green", "Current"),
+    "yellow": _status_macro("Yellow", "Behind"),
+    "red": _status_macro("Red", "At Risk"),
+})
+_UNKNOWN_STATUS_MACRO = _status_macro("Grey", "Unknown")
+
+
+def _behind_row(mb: dict[str, Any], esc: Callable[[str], str]) -> str:
+    """Render one modules-behind row of a client's expand table."""
+    mod_name = esc(mb["name"])
+    if mb.get("detail_link"):
+        mod_name = f'<a href="{esc(mb["detail_link"])}">{mod_name}</a>'
+    return (
+        f'<tr>'
+        f'<td><p>{mod_name}</p></td>'
+        f'<td><p>{esc(mb["installed"])}</p></td>'
+        f'<td><p>{esc(mb["latest"])}</p></td>'
+        f'<td><p>{esc(mb["type_label"])}{_WEIGHT_LABELS.get(mb["weight"], "")}</p></td>'
+        f'</tr>'
+    )
+
+
 def render_status_page(
     client_statuses: list[dict[str, Any]],
     round_title: str,
@@ -446,20 +618,23 @@ def render_status_page(
     """Generate Confluence storage format for the cross-client status dashboard.
 
     Args:
-        client_statuses: List of dicts from compute_client_status().
+        client_statuses: List of dicts from compute_client_status() or
+            compute_client_statuses().
         round_title: e.g. "Spring 2026".
 
     Returns:
         Confluence storage format XML string.
     """
-    color_map = {"green": "Green", "yellow": "Yellow", "red": "Red"}
-    label_map = {"green": "Current", "yellow": "Behind", "red": "At Risk"}
+    # Module names, versions and labels repeat across clients; escape each once
+    escaped: dict[str, str] = {}
 
-    rows = []
-    for cs in client_statuses:
-        conf_color = color_map.get(cs["color"], "Grey")
-        conf_label = label_map.get(cs["color"], "Unknown")
+    def esc(text: str) -> str:
+        value = escaped.get(text)
+        if value is None:
+            value = escaped[text] = escape(text)
+        return value
 
+    def status_row(cs: dict[str, Any]) -> str:
         # Client name as link to their upgrade page
         name = escape(cs["client_name"])
         if cs.get("client_page_url"):
@@ -467,71 +642,27 @@ def render_status_page(
         else:
             name_cell = name
 
-        # Status lozenge using Confluence status macro
-        status_macro = (
-            f'<ac:structured-macro ac:name="status" ac:schema-version="1">'
-            f'<ac:parameter ac:name="colour">{conf_color}</ac:parameter>'
-            f'<ac:parameter ac:name="title">{conf_label}</ac:parameter>'
-            f'</ac:structured-macro>'
-        )
-
         # Progress: up-to-date / total
         up_to_date = cs["total_modules"] - cs["behind_count"]
 
         # Expand macro with module-level detail
         if cs["modules_behind"]:
-            detail_rows = []
-            for mb in cs["modules_behind"]:
-                w_label = ""
-                if mb["weight"] == 3:
-                    w_label = " (regulatory)"
-                elif mb["weight"] == 2:
-                    w_label = " (security)"
-                mod_name = escape(mb["name"])
-                if mb.get("detail_link"):
-                    mod_name = f'<a href="{escape(mb["detail_link"])}">{mod_name}</a>'
-                detail_rows.append(
-                    f'<tr>'
-                    f'<td><p>{mod_name}</p></td>'
-                    f'<td><p>{escape(mb["installed"])}</p></td>'
-                    f'<td><p>{escape(mb["latest"])}</p></td>'
-                    f'<td><p>{escape(mb["type_label"])}{escape(w_label)}</p></td>'
-                    f'</tr>'
-                )
-            detail_table = (
-                '<table data-table-width="760" data-layout="default">'
-                '<colgroup>'
-                '<col style="width: 200.0px;" />'
-                '<col style="width: 140.0px;" />'
-                '<col style="width: 140.0px;" />'
-                '<col style="width: 280.0px;" />'
-                '</colgroup>'
-                '<tbody>'
-                '<tr>'
-                '<th><p><strong>Module</strong></p></th>'
-                '<th><p><strong>Installed</strong></p></th>'
-                '<th><p><strong>Latest</strong></p></th>'
-                '<th><p><strong>Type</strong></p></th>'
-                '</tr>'
-                + "".join(detail_rows) +
-                '</tbody>'
-                '</table>'
-            )
+            detail_rows = "".join([_behind_row(mb, esc) for mb in cs["modules_behind"]])
             expand_html = (
                 f'<ac:structured-macro ac:name="expand" ac:schema-version="1">'
                 f'<ac:parameter ac:name="title">{cs["behind_count"]} modules behind</ac:parameter>'
                 f'<ac:rich-text-body>'
-                f'{detail_table}'
+                f'{_BEHIND_TABLE_HEAD}{detail_rows}</tbody></table>'
                 f'</ac:rich-text-body>'
                 f'</ac:structured-macro>'
             )
         else:
             expand_html = '<p />'
 
-        rows.append(
+        return (
             f'<tr>'
             f'<td><p>{name_cell}</p></td>'
-            f'<td><p>{status_macro}</p></td>'
+            f'<td><p>{_STATUS_MACROS.get(cs["color"], _UNKNOWN_STATUS_MACRO)}</p></td>'
             f'<td><p>{cs["total_modules"]}</p></td>'
             f'<td><p>{cs["behind_count"]}</p></td>'
             f'<td><p>{up_to_date}</p></td>'
@@ -540,57 +671,98 @@ def render_status_page(
             f'</tr>'
         )
 
-    rows_html = "".join(rows)
+    rows_html = "".join([status_row(cs) for cs in client_statuses])
 
     return (
         f'<h2>Upgrade Status — {escape(round_title)}</h2>'
-        '<p>Weighted scoring: regulatory releases count 3x, '
-        'security/CVE patches count 2x, maintenance releases count 1x. '
-        'Green ≤ 5, Yellow 6-12, Red 13+.</p>'
-        '<table data-table-width="1200" data-layout="center">'
-        '<colgroup>'
-        '<col style="width: 160.0px;" />'
-        '<col style="width: 120.0px;" />'
-        '<col style="width: 90.0px;" />'
-        '<col style="width: 90.0px;" />'
-        '<col style="width: 110.0px;" />'
-        '<col style="width: 90.0px;" />'
-        '<col style="width: 340.0px;" />'
-        '</colgroup>'
-        '<tbody>'
-        '<tr>'
-        '<th><p><strong>Client</strong></p></th>'
-        '<th><p><strong>Status</strong></p></th>'
-        '<th><p><strong>Modules</strong></p></th>'
-        '<th><p><strong>Behind</strong></p></th>'
-        '<th><p><strong>Up to Date</strong></p></th>'
-        '<th><p><strong>Score</strong></p></th>'
-        '<th><p><strong>Details</strong></p></th>'
-        '</tr>'
+        f'{_STATUS_TABLE_HEAD}'
         f'{rows_html}'
         '</tbody>'
         '</table>'
     )
 
 
-def _defect_link(defect: Defect) -> str:
-    """Build a link to the defect in Ellucian Support."""
+@functools.lru_cache(maxsize=8192)
+def _ticket_link(table: str, sys_id: str, number: str) -> str:
+    """Build a link to a ServiceNow ticket; pure over its inputs, so cached."""
     url = (
         f"{SERVICENOW_BASE}/customer_center"
-        f"?id=standard_ticket&table=ellucian_product_defect"
-        f"&sys_id={defect.sys_id}"
+        f"?id=standard_ticket&table={table}"
+        f"&sys_id={sys_id}"
     )
-    return f'<a href="{escape(url)}">{escape(defect.number)}</a>'
-
-
-def _enhancement_link(enh: Enhancement) -> str:
-    """Build a link to the enhancement in Ellucian Support."""
-    url = (
-        f"{SERVICENOW_BASE}/customer_center"
-        f"?id=standard_ticket&table=ellucian_product_enhancement"
-        f"&sys_id={enh.sys_id}"
-    )
-    return f'<a href="{escape(url)}">{escape(enh.number)}</a>'
+    return f'<a href="{escape(url)}">{escape(number)}</a>'
+
+
+_DETAIL_HEAD = (
+    '<ac:layout>'
+    # Two-column header
+    '<ac:layout-section ac:type="two_right_sidebar" ac:breakout-mode="wide" ac:breakout-width="1800">'
+    '<ac:layout-cell>'
+    '<h3><strong>Synopsis</strong></h3>'
+)
+
+_CHANGE_TABLE_HEADER_ROW = (
+    '<tr>'
+    '<th><p><strong>Module/Version</strong></p></th>'
+    '<th><p><strong>Change Request</strong></p></th>'
+    '<th><p><strong>Details</strong></p></th>'
+    '<th><p><strong>Testing Notes</strong></p></th>'
+    '</tr>'
+)
+
+_DETAIL_ENHANCEMENTS_HEAD = (
+    '</ac:layout-cell>'
+    '<ac:layout-cell>'
+    '<ac:structured-macro ac:name="panel" ac:schema-version="1">'
+    '<ac:parameter ac:name="panelIcon">:note:</ac:parameter>'
+    '<ac:parameter ac:name="panelIconId">atlassian-note</ac:parameter>'
+    '<ac:parameter ac:name="bgColor">#F4F5F7</ac:parameter>'
+    '<ac:rich-text-body>'
+    '<p><strong>Upgrade Notes</strong></p>'
+    '</ac:rich-text-body>'
+    '</ac:structured-macro>'
+    '</ac:layout-cell>'
+    '</ac:layout-section>'
+    # Full-width body
+    '<ac:layout-section ac:type="fixed-width" ac:breakout-mode="default">'
+    '<ac:layout-cell>'
+    '<p />'
+    '<h3>Enhancements</h3>'
+    '<table data-table-width="1136" data-layout="center">'
+    '<colgroup>'
+    '<col style="width: 227.0px;" />'
+    '<col style="width: 263.0px;" />'
+    '<col style="width: 374.0px;" />'
+    '<col style="width: 272.0px;" />'
+    '</colgroup>'
+    '<tbody>'
+    f'{_CHANGE_TABLE_HEADER_ROW}'
+)
+
+_DETAIL_DEFECTS_HEAD = (
+    '</tbody>'
+    '</table>'
+    '<h3>Defects</h3>'
+    '<table data-table-width="1106" data-layout="center">'
+    '<colgroup>'
+    '<col style="width: 220.0px;" />'
+    '<col style="width: 259.0px;" />'
+    '<col style="width: 365.0px;" />'
+    '<col style="width: 262.0px;" />'
+    '</colgroup>'
+    '<tbody>'
+    f'{_CHANGE_TABLE_HEADER_ROW}'
+)
+
+_DETAIL_TAIL = (
+    '</tbody>'
+    '</table>'
+    '</ac:layout-cell>'
+    '</ac:layout-section>'
+    '</ac:layout>'
+)
+
+_EMPTY_CHANGE_ROW = "<tr><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>"
 
 
 def render_detail_page(module: UpgradeModule) -> str:
@@ -602,121 +774,57 @@ def render_detail_page(module: UpgradeModule) -> str:
     Returns:
         Confluence storage format XML string.
     """
-    # Collect all enhancements and defects across releases
-    enhancement_rows = []
-    defect_rows = []
-
+    # Collect enhancements, defects and synopsis lines in one pass over releases;
+    # rows go in as flat fragments and each table is joined exactly once
+    enhancement_rows: list[str] = []
+    defect_rows: list[str] = []
+    synopsis_parts: list[str] = []
+    add_enhancement = enhancement_rows.extend
+    add_defect = defect_rows.extend
+    # Per-change helpers as locals; links go straight to the cached builder
+    esc = escape
+    ticket_link = _ticket_link
+
+    # Summaries land in element text, never attributes, so quotes need no escaping;
+    # escape(s, False) does three replace passes instead of five on the longest fields
     for release in module.releases:
-        version = _version_from_short_desc(release.short_description)
+        version = _escaped_version(release.short_description)
 
         for enh in release.enhancements:
-            enhancement_rows.append(
-                f"<tr>"
-                f"<td><p>{escape(version)}</p></td>"
-                f"<td><p>{_enhancement_link(enh)}</p></td>"
-                f"<td><p>{escape(enh.summary)}</p></td>"
-                f"<td><p /></td>"
-                f"</tr>"
-            )
+            add_enhancement((
+                "<tr><td><p>", version,
+                "</p></td><td><p>", ticket_link("ellucian_product_enhancement", enh.sys_id, enh.number),
+                "</p></td><td><p>", esc(enh.summary, False),
+                "</p></td><td><p /></td></tr>",
+            ))
 
         for defect in release.defects:
-            defect_rows.append(
-                f"<tr>"
-                f"<td><p>{escape(version)}</p></td>"
-                f"<td><p>{_defect_link(defect)}</p></td>"
-                f"<td><p>{escape(defect.summary)}</p></td>"
-                f"<td><p /></td>"
-                f"</tr>"
-            )
-
-    # If no rows, add an empty placeholder row
-    if not enhancement_rows:
-        enhancement_rows.append(
-            "<tr><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>"
-        )
-    if not defect_rows:
-        defect_rows.append(
-            "<tr><td><p /></td><td><p /></td><td><p /></td><td><p /></td></tr>"
-        )
-
-    enhancements_html = "".join(enhancement_rows)
-    defects_html = "".join(defect_rows)
-
-    # Build synopsis from release descriptions
-    synopsis_parts = []
-    for release in module.releases:
-        version = _version_from_short_desc(release.short_description)
+            add_defect((
+                "<tr><td><p>", version,
+                "</p></td><td><p>", ticket_link("ellucian_product_defect", defect.sys_id, defect.number),
+                "</p></td><td><p>", esc(defect.summary, False),
+                "</p></td><td><p /></td></tr>",
+            ))
+
+        # Synopsis from release descriptions
         desc = release.summary or release.description or ""
         if desc and not _is_boilerplate(desc):
-            synopsis_parts.append(f"<li><p>{escape(version)}: {escape(desc)}</p></li>")
+            synopsis_parts.append(f"<li><p>{version}: {esc(desc, False)}</p></li>")
 
     if synopsis_parts:
         synopsis_html = f'<ul>{"".join(synopsis_parts)}</ul>'
     else:
         synopsis_html = "<p />"
 
+    # Empty tables get a single placeholder row
     return (
-        '<ac:layout>'
-        # Two-column header
-        '<ac:layout-section ac:type="two_right_sidebar" ac:breakout-mode="wide" ac:breakout-width="1800">'
-        '<ac:layout-cell>'
-        '<h3><strong>Synopsis</strong></h3>'
+        f'{_DETAIL_HEAD}'
         f'{synopsis_html}'
-        '</ac:layout-cell>'
-        '<ac:layout-cell>'
-        '<ac:structured-macro ac:name="panel" ac:schema-version="1">'
-        '<ac:parameter ac:name="panelIcon">:note:</ac:parameter>'
-        '<ac:parameter ac:name="panelIconId">atlassian-note</ac:parameter>'
-        '<ac:parameter ac:name="bgColor">#F4F5F7</ac:parameter>'
-        '<ac:rich-text-body>'
-        '<p><strong>Upgrade Notes</strong></p>'
-        '</ac:rich-text-body>'
-        '</ac:structured-macro>'
-        '</ac:layout-cell>'
-        '</ac:layout-section>'
-        # Full-width body
-        '<ac:layout-section ac:type="fixed-width" ac:breakout-mode="default">'
-        '<ac:layout-cell>'
-        '<p />'
-        '<h3>Enhancements</h3>'
-        '<table data-table-width="1136" data-layout="center">'
-        '<colgroup>'
-        '<col style="width: 227.0px;" />'
-        '<col style="width: 263.0px;" />'
-        '<col style="width: 374.0px;" />'
-        '<col style="width: 272.0px;" />'
-        '</colgroup>'
-        '<tbody>'
-        '<tr>'
-        '<th><p><strong>Module/Version</strong></p></th>'
-        '<th><p><strong>Change Request</strong></p></th>'
-        '<th><p><strong>Details</strong></p></th>'
-        '<th><p><strong>Testing Notes</strong></p></th>'
-        '</tr>'
-        f'{enhancements_html}'
-        '</tbody>'
-        '</table>'
-        '<h3>Defects</h3>'
-        '<table data-table-width="1106" data-layout="center">'
-        '<colgroup>'
-        '<col style="width: 220.0px;" />'
-        '<col style="width: 259.0px;" />'
-        '<col style="width: 365.0px;" />'
-        '<col style="width: 262.0px;" />'
-        '</colgroup>'
-        '<tbody>'
-        '<tr>'
-        '<th><p><strong>Module/Version</strong></p></th>'
-        '<th><p><strong>Change Request</strong></p></th>'
-        '<th><p><strong>Details</strong></p></th>'
-        '<th><p><strong>Testing Notes</strong></p></th>'
-        '</tr>'
-        f'{defects_html}'
-        '</tbody>'
-        '</table>'
-        '</ac:layout-cell>'
-        '</ac:layout-section>'
-        '</ac:layout>'
+        f'{_DETAIL_ENHANCEMENTS_HEAD}'
+        f'{"".join(enhancement_rows) or _EMPTY_CHANGE_ROW}'
+        f'{_DETAIL_DEFECTS_HEAD}'
+        f'{"".join(defect_rows) or _EMPTY_CHANGE_ROW}'
+        f'{_DETAIL_TAIL}'
     )
 
 
@@ -725,11 +833,9 @@ def _detail_page_title(module: UpgradeModule) -> str:
 
     Combines module name with version(s), e.g. "BA FIN AID 8.56/9.3.57".
     """
-    versions = []
-    for r in module.releases:
-        v = _version_from_short_desc(r.short_description)
-        if v and v not in versions:
-            versions.append(v)
+    # dict.fromkeys keeps first-seen order while deduping in O(n); map keeps the iteration in C
+    short_descriptions = map(attrgetter("short_description"), module.releases)
+    versions = [v for v in dict.fromkeys(map(_version_from_short_desc, short_descriptions)) if v]
     if versions:
         return f"{module.name} {'/'.join(versions)}"
     return module.name
@@ -740,16 +846,103 @@ def _detail_page_title(module: UpgradeModule) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _confluence_headers(user: str, token: str) -> dict[str, str]:
-    """Build auth headers for Confluence API."""
-    import base64
+@functools.lru_cache(maxsize=4)
+def _confluence_headers(user: str, token: str) -> Mapping[str, str]:
+    """Build auth headers for Confluence API.
 
+    Cached per credential pair, so the mapping is read-only to keep one
+    caller from altering the headers every later request shares.
+    """
     credentials = base64.b64encode(f"{user}:{token}".encode()).decode()
-    return {
+    return MappingProxyType({
         "Authorization": f"Basic {credentials}",
         "Content-Type": "application/json",
         "Accept": "application/json",
-    }
+    })
+
+
+@functools.cache
+def _http2_available() -> bool:
+    """Whether the optional h2 package (httpx's "http2" extra) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def confluence_client(user: str, token: str, max_connections: int = _PUBLISH_WORKERS) -> "httpx.Client":
+    """Open an HTTP client preconfigured for the Confluence REST API.
+
+    Auth and JSON headers are set once on the client rather than per
+    request, and the pool keeps a connection alive for each concurrent
+    publish worker. When h2 is installed the client negotiates HTTP/2, so
+    concurrent requests multiplex over one TLS connection; otherwise it
+    falls back to HTTP/1.1. Pass the client to create_page/update_page to
+    reuse it.
+
+    Args:
+        user: Atlassian user email.
+        token: Atlassian API token.
+        max_connections: Connection pool size; match it to the number of
+            requests issued concurrently.
+
+    Returns:
+        An httpx.Client; use it as a context manager to close it.
+    """
+    import httpx
+
+    return httpx.Client(
+        timeout=60.0,
+        http2=_http2_available(),
+        headers=_confluence_headers(user, token),
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+    )
+
+
+def _client_context(client: "httpx.Client | None", user: str, token: str):
+    """Use the caller's client as-is, or open a one-shot client for this call."""
+    if client is not None:
+        return contextlib.nullcontext(client)
+    return confluence_client(user, token)
+
+
+def _error_excerpt(resp: "httpx.Response", limit: int = 500) -> str:
+    """Decode just the start of an error body instead of the whole response."""
+    return resp.content[:limit].decode("utf-8", "replace")
+
+
+def _retry_delay(resp: "httpx.Response", attempt: int) -> float:
+    """Seconds to wait before retrying: the server's Retry-After, else jittered backoff."""
+    try:
+        retry_after = float(resp.headers.get("Retry-After", ""))
+    except ValueError:
+        retry_after = math.nan
+    # "nan" and "inf" parse as floats but are no usable delay; treat them as absent
+    if not math.isfinite(retry_after):
+        return min(2**attempt + random.random(), _MAX_RETRY_DELAY)
+    return min(max(retry_after, 0.0), _MAX_RETRY_DELAY)
+
+
+def _send_with_retry(send: Callable[..., "httpx.Response"], url: str, content: bytes) -> "httpx.Response":
+    """Send a request, retrying rate limiting and transient gateway errors.
+
+    One 502 partway through a large round would otherwise abort the publish
+    and force every page to be created again. Confluence rejects a
+    duplicate title in the same space, so a create that did land before its
+    error response fails loudly on retry rather than duplicating the page.
+
+    Args:
+        send: Bound client method, e.g. client.post or client.put.
+        url: Request URL.
+        content: Encoded JSON request body.
+
+    Returns:
+        The first non-retryable response, or the last response once retries
+        are exhausted; callers check the status as usual.
+    """
+    for attempt in range(_MAX_RETRIES):
+        resp = send(url, content=content)
+        if resp.status_code not in _RETRY_STATUSES:
+            return resp
+        time.sleep(_retry_delay(resp, attempt))
+    return send(url, content=content)
 
 
 def create_page(
@@ -760,6 +953,7 @@ def create_page(
     user: str,
     token: str,
     site: str,
+    client: "httpx.Client | None" = None,
 ) -> dict[str, Any]:
     """Create a Confluence page via REST API v2.
 
@@ -771,6 +965,8 @@ def create_page(
         user: Atlassian user email.
         token: Atlassian API token.
         site: Atlassian site (e.g. "apogeetelecom.atlassian.net").
+        client: Optional client from confluence_client() to reuse; a new one
+            is opened if omitted.
 
     Returns:
         Page metadata dict including id, _links.tinyui.
@@ -779,7 +975,6 @@ def create_page(
         ConfluenceError: If creation fails.
     """
     url = f"https://{site}/wiki/api/v2/pages"
-    headers = _confluence_headers(user, token)
 
     payload = {
         "spaceId": space_id,
@@ -792,12 +987,12 @@ def create_page(
         },
     }
 
-    with httpx.Client(timeout=60.0) as client:
-        resp = client.post(url, headers=headers, json=payload)
+    with _client_context(client, user, token) as c:
+        resp = _send_with_retry(c.post, url, orjson.dumps(payload))
 
     if resp.status_code not in (200, 201):
         raise ConfluenceError(
-            f"Failed to create page '{title}': HTTP {resp.status_code} — {resp.text[:500]}"
+            f"Failed to create page '{title}': HTTP {resp.status_code} — {_error_excerpt(resp)}"
         )
 
     return resp.json()
@@ -811,6 +1006,7 @@ def update_page(
     user: str,
     token: str,
     site: str,
+    client: "httpx.Client | None" = None,
 ) -> dict[str, Any]:
     """Update an existing Confluence page via REST API v2.
 
@@ -822,6 +1018,8 @@ def update_page(
         user: Atlassian user email.
         token: Atlassian API token.
         site: Atlassian site.
+        client: Optional client from confluence_client() to reuse; a new one
+            is opened if omitted.
 
     Returns:
         Updated page metadata.
@@ -830,7 +1028,6 @@ def update_page(
         ConfluenceError: If update fails.
     """
     url = f"https://{site}/wiki/api/v2/pages/{page_id}"
-    headers = _confluence_headers(user, token)
 
     payload = {
         "id": page_id,
@@ -843,12 +1040,12 @@ def update_page(
         },
     }
 
-    with httpx.Client(timeout=60.0) as client:
-        resp = client.put(url, headers=headers, json=payload)
+    with _client_context(client, user, token) as c:
+        resp = _send_with_retry(c.put, url, orjson.dumps(payload))
 
     if resp.status_code != 200:
         raise ConfluenceError(
-            f"Failed to update page {page_id}: HTTP {resp.status_code} — {resp.text[:500]}"
+            f"Failed to update page {page_id}: HTTP {resp.status_code} — {_error_excerpt(resp)}"
         )
 
     return resp.json()
@@ -863,11 +1060,12 @@ def publish_upgrade_round(
     site: str,
     dry_run: bool = False,
     progress_callback=None,
+    concurrency: int = _PUBLISH_WORKERS,
 ) -> dict[str, Any]:
     """Publish a complete upgrade round to Confluence.
 
-    Creates detail pages first (to get tinyui links), then creates the
-    root page with links to details.
+    Creates the root page, then its detail pages concurrently (to get
+    tinyui links), then updates the root page with links to details.
 
     Args:
         round_: The upgrade round data.
@@ -878,6 +1076,8 @@ def publish_upgrade_round(
         site: Atlassian site.
         dry_run: If True, generate HTML but don't create pages.
         progress_callback: Optional callable(message: str).
+        concurrency: Maximum number of page requests in flight at once. Lower
+            it if Confluence starts rate limiting.
 
     Returns:
         Dict with root_page info and detail_pages list.
@@ -900,45 +1100,67 @@ def publish_upgrade_round(
         _log(f"Would create 1 root + {len(round_.modules)} detail pages")
         return result
 
-    # Step 1: Create root page first (needed as parent for detail pages)
-    _log(f"Creating root page: {round_.title}")
-    root_body = render_root_page(round_)  # Initial version without detail links
-    root_page = create_page(round_.title, space_id, parent_id, root_body, user, token, site)
-    root_page_id = root_page["id"]
-    _log(f"  Root page created: id={root_page_id}")
-
-    # Step 2: Create detail pages as children of root
-    detail_links = {}
-    for i, module in enumerate(round_.modules, 1):
-        title = _detail_page_title(module)
-        _log(f"  Creating detail page ({i}/{len(round_.modules)}): {title}")
-        body = render_detail_page(module)
-        detail_page = create_page(title, space_id, root_page_id, body, user, token, site)
-        tinyui = detail_page.get("_links", {}).get("tinyui", "")
-        if tinyui and not tinyui.startswith("http"):
-            tinyui = f"https://{site}/wiki{tinyui}"
-        detail_links[module.name] = tinyui
-        result["detail_pages"].append({
-            "title": title,
-            "id": detail_page["id"],
-            "url": tinyui,
-        })
-
-    # Step 3: Update root page with detail links
-    _log("Updating root page with detail links...")
-    root_body_with_links = render_root_page(round_, detail_links)
-    updated_root = update_page(
-        root_page_id, round_.title, root_body_with_links,
-        version=2, user=user, token=token, site=site,
-    )
-    root_tinyui = updated_root.get("_links", {}).get("tinyui", "")
-    if root_tinyui and not root_tinyui.startswith("http"):
-        root_tinyui = f"https://{site}/wiki{root_tinyui}"
-    result["root_page"] = {
-        "title": round_.title,
-        "id": root_page_id,
-        "url": root_tinyui,
-    }
+    # One pooled client for the whole run so every call reuses the same connections
+    with (
+        confluence_client(user, token, max_connections=concurrency) as client,
+        ThreadPoolExecutor(max_workers=concurrency) as executor,
+    ):
+        # Step 1: Create root page first (needed as parent for detail pages).
+        # The request runs in the pool so detail bodies render while it is in flight.
+        _log(f"Creating root page: {round_.title}")
+        root_future = executor.submit(
+            create_page, round_.title, space_id, parent_id,
+            render_root_page(round_),  # Initial version without detail links
+            user, token, site, client,
+        )
+        titles = [_detail_page_title(module) for module in round_.modules]
+        bodies = [render_detail_page(module) for module in round_.modules]
+        root_page_id = root_future.result()["id"]
+        _log(f"  Root page created: id={root_page_id}")
+
+        # Step 2: Create detail pages as children of root, several requests in flight
+        detail_links = {}
+        total = len(round_.modules)
+        futures = {
+            executor.submit(create_page, title, space_id, root_page_id, body, user, token, site, client): i
+            for i, (title, body) in enumerate(zip(titles, bodies))
+        }
+        # Pending requests now hold the only references to the bodies, so each
+        # one is freed as soon as its page is created rather than at the end
+        bodies.clear()
+        # Report pages as they actually finish, but keep results in module order
+        detail_pages = [None] * total
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            detail_pages[i] = future.result()
+            _log(f"  Created detail page ({done}/{total}): {titles[i]}")
+
+        for module, title, detail_page in zip(round_.modules, titles, detail_pages):
+            tinyui = detail_page.get("_links", {}).get("tinyui", "")
+            if tinyui and not tinyui.startswith("http"):
+                tinyui = f"https://{site}/wiki{tinyui}"
+            detail_links[module.name] = tinyui
+            result["detail_pages"].append({
+                "title": title,
+                "id": detail_page["id"],
+                "url": tinyui,
+            })
+
+        # Step 3: Update root page with detail links
+        _log("Updating root page with detail links...")
+        root_body_with_links = render_root_page(round_, detail_links)
+        updated_root = update_page(
+            root_page_id, round_.title, root_body_with_links,
+            version=2, user=user, token=token, site=site, client=client,
+        )
+        root_tinyui = updated_root.get("_links", {}).get("tinyui", "")
+        if root_tinyui and not root_tinyui.startswith("http"):
+            root_tinyui = f"https://{site}/wiki{root_tinyui}"
+        result["root_page"] = {
+            "title": round_.title,
+            "id": root_page_id,
+            "url": root_tinyui,
+        }
 
     _log(f"Published {round_.title}: 1 root + {len(round_.modules)} detail pages")
     return result
@@ -4,14 +4,19 @@ The Ellucian Download Center is hosted on FlexNet Operations and requires
 separate SAML authentication through Okta (different from ServiceNow support).
 """
 
-import html as html_module
+import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable
-from urllib.parse import unquote_plus, urljoin
+from typing import Callable, Iterable, Iterator
+from urllib.parse import parse_qs, urlsplit
 
 import httpx
+import lxml.etree
+import lxml.html
 
 from .auth import AuthSession
 
@@ -22,6 +27,29 @@ DOWNLOAD_CENTER_SSO_URL = (
 FLEXNET_BASE = "https://ellucian.flexnetoperations.com"
 DEFAULT_ORG_ID = "001G000000iHmhmIAC"  # Default organization ID
 
+# Files at least this large are fetched as parallel byte ranges when the server supports it
+PARALLEL_DOWNLOAD_MIN_BYTES = 64 * 1024 * 1024
+DOWNLOAD_RANGE_PARTS = 4
+
+# How long a fetched product list is reused before the chart is downloaded again
+PRODUCT_LIST_TTL = 300.0
+
+# Bytes gathered per file write; one vectored syscall flushes each batch of network chunks
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _iov_max() -> int:
+    """Most buffers one writev/pwritev call accepts (more fails with EINVAL)."""
+    try:
+        limit = os.sysconf("SC_IOV_MAX")
+    except (AttributeError, ValueError, OSError):
+        limit = -1
+    # POSIX guarantees at least 16; Linux and macOS report 1024
+    return limit if limit > 0 else 1024
+
+
+_IOV_MAX = _iov_max()
+
 
 class DownloadCenterError(Exception):
     """Error from download center operations."""
@@ -29,7 +57,118 @@ class DownloadCenterError(Exception):
     pass
 
 
-@dataclass
+def _parse_html(text: str) -> lxml.html.HtmlElement:
+    """Parse a FlexNet page into an lxml tree (libxml2, one pass over the markup)."""
+    try:
+        return lxml.html.document_fromstring(text)
+    except lxml.etree.ParserError:
+        # Empty or whitespace-only body
+        return lxml.html.Element("html")
+
+
+def _query_param(href: str, name: str) -> str:
+    """Return a decoded query-string parameter from a link, or "" if absent."""
+    values = parse_qs(urlsplit(href).query, keep_blank_values=True).get(name)
+    return values[0] if values else ""
+
+
+def _batched(chunks: Iterable[bytes], size: int, max_chunks: int = _IOV_MAX) -> Iterator[list[bytes]]:
+    """Group stream chunks into batches of at least size bytes (the last may be smaller).
+
+    A batch is also cut at max_chunks chunks, so a stream of many small
+    chunks never exceeds the buffer limit of one vectored write.
+    """
+    batch: list[bytes] = []
+    batch_bytes = 0
+    for chunk in chunks:
+        batch.append(chunk)
+        batch_bytes += len(chunk)
+        if batch_bytes >= size or len(batch) >= max_chunks:
+            yield batch
+            batch = []
+            batch_bytes = 0
+    if batch:
+        yield batch
+
+
+def _write_batch(fd: int, batch: list[bytes], offset: int | None = None) -> int:
+    """Write a batch of chunks with one vectored syscall, at offset if given.
+
+    The chunks go to the kernel as-is rather than being joined into one
+    buffer first. A short write, or a platform without os.writev, finishes
+    with plain writes.
+
+    Returns:
+        Number of bytes written (the batch size)
+    """
+    size = sum(map(len, batch))
+    if offset is not None:
+        written = os.pwritev(fd, batch, offset)
+    elif hasattr(os, "writev"):
+        written = os.writev(fd, batch)
+    else:
+        written = 0
+    if written < size:
+        rest = memoryview(b"".join(batch))[written:]
+        while rest:
+            if offset is None:
+                n = os.write(fd, rest)
+            else:
+                n = os.pwrite(fd, rest, offset + size - len(rest))
+            rest = rest[n:]
+    return size
+
+
+# Link selectors, compiled once rather than on every page parse
+_PRODUCT_LINKS = lxml.etree.XPath(
+    '//a[starts-with(@href, "/flexnet/operationsportal/downloadPackageVersions.action?")]'
+)
+_PACKAGE_LINKS = lxml.etree.XPath(
+    '//a[starts-with(@href, "/flexnet/operationsportal/entitledDownloadFile.action?")]'
+)
+_FILE_LINKS = lxml.etree.XPath(
+    '//a[contains(concat(" ", normalize-space(@class), " "), " download-link ")]'
+    '[starts-with(@href, "https://download.flexnetoperations.com")]'
+)
+
+
+# The auto-submitting SAML form on the Okta app page
+_SAML_FORM = lxml.etree.XPath('//form[@action][.//input[@name="SAMLResponse"][@value != ""]]')
+
+# Table cell contents: file sizes ("250.5 MB") and dates ("Mar 19, 2026")
+_SIZE_RE = re.compile(r"([0-9.]+)\s*([KMGT]?)B", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+_DATE_RE = re.compile(r"[A-Z][a-z]{2}\s+\d{1,2},\s+\d{4}", re.IGNORECASE)
+
+
+def _size_bytes(size: str) -> int | None:
+    """Approximate byte count of a listed size such as "250.5 MB", or None if unknown."""
+    m = _SIZE_RE.fullmatch(size.strip())
+    if not m:
+        return None
+    try:
+        return int(float(m.group(1)) * _SIZE_UNITS[m.group(2).upper()])
+    except ValueError:
+        return None
+
+
+def _row_cell(link: lxml.html.HtmlElement, pattern: re.Pattern[str]) -> str:
+    """Return the first cell in the link's table row whose text matches pattern.
+
+    Walks up to the enclosing <tr> and across its cells directly, so each
+    lookup touches one row instead of evaluating a path expression.
+    """
+    row = next(link.iterancestors("tr"), None)
+    if row is None:
+        return ""
+    for cell in row.iterchildren("td"):
+        text = cell.text_content().strip()
+        if pattern.fullmatch(text):
+            return text
+    return ""
+
+
+@dataclass(slots=True)
 class DownloadPackage:
     """A downloadable package (product version)."""
 
@@ -40,7 +179,7 @@ class DownloadPackage:
     org_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadFile:
     """A downloadable file within a package."""
 
@@ -72,6 +211,8 @@ class FlexNetClient:
         self._progress = progress_callback or (lambda x: None)
         self._client: httpx.Client | None = None
         self._authenticated = False
+        # (fetched_at, products) from the last list_products() call
+        self._products: tuple[float, list[tuple[str, str]]] | None = None
 
     def _ensure_authenticated(self) -> None:
         """Authenticate to FlexNet if not already authenticated."""
@@ -89,20 +230,19 @@ class FlexNetClient:
         # Get SAML response from Okta
         resp = self._client.get(DOWNLOAD_CENTER_SSO_URL, follow_redirects=True)
 
-        # Extract SAML form
-        saml_match = re.search(r'name="SAMLResponse"[^>]*value="([^"]+)"', resp.text)
-        relay_match = re.search(r'name="RelayState"[^>]*value="([^"]+)"', resp.text)
-        action_match = re.search(r'<form[^>]+action="([^"]+)"', resp.text)
-
-        if not saml_match or not action_match:
+        # Extract SAML form: one parse yields the action and every input, with entities decoded
+        forms = _SAML_FORM(_parse_html(resp.text))
+        if not forms:
             raise DownloadCenterError("Could not get SAML response from Okta")
 
-        saml_response = html_module.unescape(saml_match.group(1))
-        relay_state = html_module.unescape(relay_match.group(1)) if relay_match else ""
-        action_url = html_module.unescape(action_match.group(1))
+        form = forms[0]
+        fields = {i.get("name"): i.get("value") or "" for i in form.iterdescendants("input")}
+        saml_response = fields["SAMLResponse"]
+        relay_state = fields.get("RelayState", "")
+        action_url = form.get("action")
 
-        # Post SAML to FlexNet
-        resp2 = self._client.post(
+        # Post SAML to FlexNet; httpx follows the redirect chain on the same pooled connection
+        self._client.post(
             action_url,
             data={"SAMLResponse": saml_response, "RelayState": relay_state},
             headers={
@@ -110,24 +250,25 @@ class FlexNetClient:
                 "Origin": "https://sso.ellucian.com",
                 "Referer": "https://sso.ellucian.com/",
             },
+            follow_redirects=True,
         )
 
-        # Follow redirects
-        while resp2.status_code in (301, 302, 303):
-            location = resp2.headers.get("location", "")
-            if not location.startswith("http"):
-                location = urljoin(str(resp2.url), location)
-            resp2 = self._client.get(location)
-
         self._authenticated = True
         self._progress("Authenticated to FlexNet")
 
     def list_products(self) -> list[tuple[str, str]]:
         """List all available products (download lines).
 
+        The product chart is large and rarely changes, so the parsed list is
+        reused for PRODUCT_LIST_TTL seconds; repeated search_products() calls
+        don't download and parse it again.
+
         Returns:
             List of (line_id, display_name) tuples
         """
+        if self._products and time.monotonic() - self._products[0] < PRODUCT_LIST_TTL:
+            return list(self._products[1])
+
         self._ensure_authenticated()
         assert self._client is not None
 
@@ -138,22 +279,17 @@ class FlexNetClient:
             raise DownloadCenterError(f"Failed to list products: {resp.status_code}")
 
         # Extract product links
-        pattern = (
-            r'href="/flexnet/operationsportal/downloadPackageVersions\.action\?'
-            r'lineId=([^&"]+)&amp;orgId=([^"]+)"[^>]*>([^<]+)</a>'
-        )
-        matches = re.findall(pattern, resp.text)
-
         products = []
         seen = set()
-        for line_id, org_id, name in matches:
-            line_id = html_module.unescape(line_id)
-            name = html_module.unescape(name).strip()
-            if line_id not in seen:
+        for link in _PRODUCT_LINKS(_parse_html(resp.text)):
+            line_id = _query_param(link.get("href"), "lineId")
+            name = link.text_content().strip()
+            if line_id and name and line_id not in seen:
                 seen.add(line_id)
                 products.append((line_id, name))
 
-        return products
+        self._products = (time.monotonic(), products)
+        return list(products)
 
     def search_products(self, query: str) -> list[tuple[str, str]]:
         """Search for products matching a query.
@@ -191,6 +327,29 @@ class FlexNetClient:
         # If no packages found, treat it as a direct package ID
         return self.get_package_files(product)
 
+    def get_files_for_products(
+        self,
+        products: list[str],
+        concurrency: int = 10,
+    ) -> dict[str, list[DownloadFile]]:
+        """Get downloadable files for several products at once.
+
+        Each product is looked up as in get_files_for_product, with up to
+        `concurrency` products in flight over the shared connection pool.
+
+        Args:
+            products: Line IDs or package names
+            concurrency: Maximum number of products fetched at the same time
+
+        Returns:
+            Map of product -> downloadable files, in the order given
+        """
+        # Authenticate once up front rather than racing from every worker
+        self._ensure_authenticated()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return dict(zip(products, executor.map(self.get_files_for_product, products)))
+
     def get_package_files(
         self,
         download_pkg_id: str,
@@ -220,26 +379,16 @@ class FlexNetClient:
             raise DownloadCenterError(f"Failed to get package files: {resp.status_code}")
 
         # Extract file download links
-        # Pattern: <a href="https://download.flexnetoperations.com/...">filename</a>
-        pattern = (
-            r'<a\s+href="(https://download\.flexnetoperations\.com[^"]+)"[^>]*class="download-link"[^>]*>([^<]+)</a>'
-        )
-        matches = re.findall(pattern, resp.text, re.IGNORECASE)
-
+        # Pattern: <a href="https://download.flexnetoperations.com/..." class="download-link">filename</a>
         files = []
-        for url, name in matches:
-            url = html_module.unescape(url)
-            name = html_module.unescape(name).strip()
-
-            # Try to get size from nearby cell
-            size = ""
-            size_match = re.search(
-                rf"{re.escape(name)}.*?<td[^>]*>([0-9.]+\s*[KMGT]?B)</td>",
-                resp.text,
-                re.DOTALL | re.IGNORECASE,
-            )
-            if size_match:
-                size = size_match.group(1)
+        for link in _FILE_LINKS(_parse_html(resp.text)):
+            url = link.get("href")
+            name = link.text_content().strip()
+            if not name:
+                continue
+
+            # Size comes from a cell in the same table row
+            size = _row_cell(link, _SIZE_RE)
 
             files.append(
                 DownloadFile(
@@ -270,20 +419,22 @@ class FlexNetClient:
         self._ensure_authenticated()
         assert self._client is not None
 
-        packages = []
-
-        # Get new versions
+        client = self._client
         url = f"{FLEXNET_BASE}/flexnet/operationsportal/downloadPackageVersions.action"
-        params = {"lineId": line_id, "datatype": "new"}
-        resp = self._client.get(url, params=params)
 
-        if resp.status_code == 200:
-            packages.extend(self._parse_packages(resp.text, line_id))
+        def fetch(datatype: str) -> httpx.Response:
+            return client.get(url, params={"lineId": line_id, "datatype": datatype})
 
-        # Get archived versions if requested
+        # New versions first, then archived versions if requested. The two
+        # listings are independent pages, so both requests go out at once.
         if include_archived:
-            params["datatype"] = "archive"
-            resp = self._client.get(url, params=params)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                responses = list(executor.map(fetch, ("new", "archive")))
+        else:
+            responses = [fetch("new")]
+
+        packages = []
+        for resp in responses:
             if resp.status_code == 200:
                 packages.extend(self._parse_packages(resp.text, line_id))
 
@@ -293,28 +444,18 @@ class FlexNetClient:
         """Parse package list from HTML."""
         packages = []
 
-        # Pattern for package links - orgId may be empty
-        pattern = (
-            r'<a\s+href="/flexnet/operationsportal/entitledDownloadFile\.action\?'
-            r'downloadPkgId=([^&"]+)&(?:amp;)?orgId=([^"]*)"[^>]*>([^<]+)</a>'
-        )
-        matches = re.findall(pattern, html)
-
-        for pkg_id, org_id, name in matches:
-            # Decode URL-encoded characters (+ for space, %XX)
-            pkg_id = unquote_plus(html_module.unescape(pkg_id))
-            org_id = unquote_plus(html_module.unescape(org_id))
-            name = html_module.unescape(name).strip()
-
-            # Try to extract date
-            date = ""
-            date_match = re.search(
-                rf"{re.escape(name)}.*?<td[^>]*>([A-Z][a-z]{{2}}\s+\d{{1,2}},\s+\d{{4}})</td>",
-                html,
-                re.DOTALL | re.IGNORECASE,
-            )
-            if date_match:
-                date = date_match.group(1)
+        # Package links; orgId may be empty
+        for link in _PACKAGE_LINKS(_parse_html(html)):
+            # parse_qs decodes URL-encoded characters (+ for space, %XX)
+            href = link.get("href")
+            pkg_id = _query_param(href, "downloadPkgId")
+            org_id = _query_param(href, "orgId")
+            name = link.text_content().strip()
+            if not pkg_id or not name:
+                continue
+
+            # Date comes from a cell in the same table row
+            date = _row_cell(link, _DATE_RE)
 
             packages.append(
                 DownloadPackage(
@@ -352,6 +493,17 @@ class FlexNetClient:
 
         self._progress(f"Downloading {file.name}...")
 
+        # Large installers download faster as several ranges over separate connections.
+        # Only ask the server about ranges when the listing doesn't already show a small file.
+        listed_size = _size_bytes(file.size)
+        ranged_total = 0
+        if listed_size is None or listed_size >= PARALLEL_DOWNLOAD_MIN_BYTES:
+            ranged_total = self._ranged_download_size(file.download_url)
+        if ranged_total:
+            self._download_ranges(file, output_path, ranged_total, progress_callback)
+            self._progress(f"Downloaded {file.name}")
+            return output_path
+
         # Stream download
         with self._client.stream("GET", file.download_url) as resp:
             if resp.status_code != 200:
@@ -360,22 +512,82 @@ class FlexNetClient:
             total = int(resp.headers.get("content-length", 0))
             downloaded = 0
 
-            with open(output_path, "wb") as f:
-                for chunk in resp.iter_bytes(chunk_size=8192):
-                    f.write(chunk)
-                    downloaded += len(chunk)
+            # Unbuffered: batches go straight to the file descriptor
+            with open(output_path, "wb", buffering=0) as f:
+                fd = f.fileno()
+                for batch in _batched(resp.iter_bytes(), DOWNLOAD_CHUNK_SIZE):
+                    downloaded += _write_batch(fd, batch)
                     if progress_callback:
                         progress_callback(downloaded, total)
 
         self._progress(f"Downloaded {file.name}")
         return output_path
 
+    def _ranged_download_size(self, url: str) -> int:
+        """Return the file size if it should be fetched in byte ranges, else 0.
+
+        Ranges are used only for large files from servers that advertise
+        byte-range support, and only where os.pwritev is available.
+        """
+        assert self._client is not None
+        if not hasattr(os, "pwritev"):
+            return 0
+
+        resp = self._client.head(url)
+        if resp.status_code != 200 or resp.headers.get("accept-ranges", "").lower() != "bytes":
+            return 0
+
+        total = int(resp.headers.get("content-length", 0))
+        return total if total >= PARALLEL_DOWNLOAD_MIN_BYTES else 0
+
+    def _download_ranges(
+        self,
+        file: DownloadFile,
+        output_path: Path,
+        total: int,
+        progress_callback: Callable[[int, int], None] | None,
+    ) -> None:
+        """Download a file as parallel byte ranges written in place at their offsets."""
+        assert self._client is not None
+        client = self._client
+        part_size = -(-total // DOWNLOAD_RANGE_PARTS)
+        ranges = [(start, min(start + part_size, total) - 1) for start in range(0, total, part_size)]
+        lock = threading.Lock()
+        downloaded = 0
+
+        with open(output_path, "wb") as f:
+            f.truncate(total)
+            fd = f.fileno()
+
+            def fetch(byte_range: tuple[int, int]) -> None:
+                nonlocal downloaded
+                start, end = byte_range
+                offset = start
+                headers = {"Range": f"bytes={start}-{end}"}
+                with client.stream("GET", file.download_url, headers=headers) as resp:
+                    if resp.status_code != 206:
+                        raise DownloadCenterError(f"Download failed: {resp.status_code} - {file.name}")
+                    for batch in _batched(resp.iter_bytes(), DOWNLOAD_CHUNK_SIZE):
+                        written = _write_batch(fd, batch, offset)
+                        offset += written
+                        if progress_callback:
+                            with lock:
+                                downloaded += written
+                                progress_callback(downloaded, total)
+                if offset != end + 1:
+                    raise DownloadCenterError(f"Download incomplete: {file.name}")
+
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                # list() re-raises the first failed range
+                list(executor.map(fetch, ranges))
+
     def close(self) -> None:
         """Close the HTTP client."""
         if self._client:
             self._client.close()
             self._client = None
         self._authenticated = False
+        self._products = None
 
     def __enter__(self) -> "FlexNetClient":
         return self
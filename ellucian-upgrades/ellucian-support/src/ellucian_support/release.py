@@ -4,16 +4,22 @@ Fetches product releases with related defects and enhancements from
 the ServiceNow-based Ellucian Customer Center.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
-
-import httpx
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable
 
 from .auth import AuthSession
 from .search import SearchResponse, search
 
+if TYPE_CHECKING:
+    import httpx
+
 SERVICENOW_BASE = "https://elluciansupport.service-now.com"
 
+# Prerequisite sys_ids per sys_idIN query (each ID adds 33 characters to the URL)
+_PREREQ_IDS_PER_QUERY = 50
+
 
 class ReleaseError(Exception):
     """Release operation failed."""
@@ -235,8 +241,10 @@ DEFAULT_QUERY_FIELDS = (
 )
 
 
-def _make_client(session: AuthSession) -> httpx.Client:
+def _make_client(session: AuthSession) -> "httpx.Client":
     """Create an httpx client with session cookies set."""
+    import httpx
+
     client = httpx.Client(timeout=30.0)
     for name, value in session.cookies.items():
         client.cookies.set(name, value, domain="elluciansupport.service-now.com")
@@ -334,6 +342,8 @@ def get_release(session: AuthSession, sys_id: str) -> Release:
     Raises:
         ReleaseError: If fetch fails.
     """
+    import httpx
+
     with httpx.Client(timeout=30.0) as client:
         for name, value in session.cookies.items():
             client.cookies.set(name, value, domain="elluciansupport.service-now.com")
@@ -349,7 +359,7 @@ def get_release(session: AuthSession, sys_id: str) -> Release:
 
 
 def _get_related_ids_from_page(
-    client: httpx.Client, sys_id: str
+    client: "httpx.Client", sys_id: str
 ) -> tuple[list[str], list[str], list[str]]:
     """Extract related defect/enhancement/prerequisite IDs from SP page API.
 
@@ -404,31 +414,35 @@ def _get_related_ids_from_page(
     return defect_ids, enhancement_ids, prerequisite_ids
 
 
-def _fetch_defects(client: httpx.Client, sys_ids: list[str]) -> list[Defect]:
+def _fetch_defect(client: "httpx.Client", sys_id: str) -> Defect | None:
+    """Fetch one defect by sys_id, or None if it cannot be read."""
+    url = f"{SERVICENOW_BASE}/api/now/table/ellucian_product_defect/{sys_id}"
+    resp = client.get(url, headers={"Accept": "application/json"})
+    if resp.status_code != 200:
+        return None
+    return Defect.from_api(resp.json().get("result", {}))
+
+
+def _fetch_enhancement(client: "httpx.Client", sys_id: str) -> Enhancement | None:
+    """Fetch one enhancement by sys_id, or None if it cannot be read."""
+    url = f"{SERVICENOW_BASE}/api/now/table/ellucian_product_enhancement/{sys_id}"
+    resp = client.get(url, headers={"Accept": "application/json"})
+    if resp.status_code != 200:
+        return None
+    return Enhancement.from_api(resp.json().get("result", {}))
+
+
+def _fetch_defects(client: "httpx.Client", sys_ids: list[str]) -> list[Defect]:
     """Fetch defect details by sys_ids (individually to avoid 403 on query)."""
-    results = []
-    for sys_id in sys_ids:
-        url = f"{SERVICENOW_BASE}/api/now/table/ellucian_product_defect/{sys_id}"
-        resp = client.get(url, headers={"Accept": "application/json"})
-        if resp.status_code == 200:
-            data = resp.json().get("result", {})
-            results.append(Defect.from_api(data))
-    return results
+    return [d for sys_id in sys_ids if (d := _fetch_defect(client, sys_id))]
 
 
-def _fetch_enhancements(client: httpx.Client, sys_ids: list[str]) -> list[Enhancement]:
+def _fetch_enhancements(client: "httpx.Client", sys_ids: list[str]) -> list[Enhancement]:
     """Fetch enhancement details by sys_ids (individually to avoid 403 on query)."""
-    results = []
-    for sys_id in sys_ids:
-        url = f"{SERVICENOW_BASE}/api/now/table/ellucian_product_enhancement/{sys_id}"
-        resp = client.get(url, headers={"Accept": "application/json"})
-        if resp.status_code == 200:
-            data = resp.json().get("result", {})
-            results.append(Enhancement.from_api(data))
-    return results
+    return [e for sys_id in sys_ids if (e := _fetch_enhancement(client, sys_id))]
 
 
-def _fetch_prerequisites(client: httpx.Client, sys_ids: list[str]) -> list[str]:
+def _fetch_prerequisites(client: "httpx.Client", sys_ids: list[str]) -> list[str]:
     """Fetch prerequisite release short_descriptions by sys_ids.
 
     Returns just the short_description strings (e.g. "BA GENERAL 8.25")
@@ -447,6 +461,41 @@ def _fetch_prerequisites(client: httpx.Client, sys_ids: list[str]) -> list[str]:
     return results
 
 
+def _fetch_prerequisite_names(client: "httpx.Client", sys_ids: list[str]) -> dict[str, str]:
+    """Fetch short_descriptions for many prerequisite releases with few queries.
+
+    The release table (unlike the defect and enhancement tables) accepts a
+    sys_idIN query, sent for up to _PREREQ_IDS_PER_QUERY IDs at a time to
+    keep the URL short. The Table API can leave ACL-restricted rows out of
+    a query result without an error, so any ID the queries did not return
+    (or all of them, if a query is refused) is fetched on its own.
+
+    Returns:
+        Dict of sys_id → short_description for the releases found.
+    """
+    url = f"{SERVICENOW_BASE}/api/now/table/ellucian_product_release"
+    names: dict[str, str] = {}
+    for start in range(0, len(sys_ids), _PREREQ_IDS_PER_QUERY):
+        chunk = sys_ids[start:start + _PREREQ_IDS_PER_QUERY]
+        params = {
+            "sysparm_query": "sys_idIN" + ",".join(chunk),
+            "sysparm_fields": "sys_id,short_description",
+            "sysparm_limit": str(len(chunk)),
+        }
+        resp = client.get(url, params=params, headers={"Accept": "application/json"})
+        if resp.status_code == 200:
+            for r in resp.json().get("result", []):
+                if r.get("sys_id") and r.get("short_description"):
+                    names[r["sys_id"]] = r["short_description"]
+
+    for sys_id in sys_ids:
+        if sys_id not in names:
+            found = _fetch_prerequisites(client, [sys_id])
+            if found:
+                names[sys_id] = found[0]
+    return names
+
+
 def enrich_release(session: AuthSession, release: Release) -> Release:
     """Fetch and attach defects/enhancements/prerequisites to a release.
 
@@ -462,6 +511,8 @@ def enrich_release(session: AuthSession, release: Release) -> Release:
     Raises:
         ReleaseError: If enrichment fails.
     """
+    import httpx
+
     with httpx.Client(timeout=30.0) as client:
         for name, value in session.cookies.items():
             client.cookies.set(name, value, domain="elluciansupport.service-now.com")
@@ -482,6 +533,66 @@ def enrich_release(session: AuthSession, release: Release) -> Release:
     return release
 
 
+def enrich_releases(
+    session: AuthSession,
+    releases: list[Release],
+    batch_size: int = 50,
+    concurrency: int = 8,
+    progress_callback: Callable[[str], None] | None = None,
+) -> list[Release]:
+    """Fetch and attach defects/enhancements/prerequisites to many releases.
+
+    Equivalent to calling enrich_release on each release, but with one
+    shared client and far fewer requests. Releases are handled in batches:
+    the related-item IDs for a batch are read concurrently, prerequisite
+    names are fetched with a single query, and each distinct defect or
+    enhancement is fetched once however many releases link to it.
+
+    Args:
+        session: Authenticated session with cookies.
+        releases: Release objects to enrich in place.
+        batch_size: Releases whose related items are looked up together.
+        concurrency: Maximum number of requests in flight at once.
+        progress_callback: Optional callable(message: str) called for each release.
+
+    Returns:
+        The same Release objects, populated.
+    """
+    defects: dict[str, Defect | None] = {}
+    enhancements: dict[str, Enhancement | None] = {}
+    total = len(releases)
+
+    with _make_client(session) as client, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for start in range(0, total, batch_size):
+            batch = releases[start:start + batch_size]
+            related = list(executor.map(lambda r: _get_related_ids_from_page(client, r.sys_id), batch))
+
+            # Only fetch items no earlier release has linked to (dict.fromkeys keeps first-seen order)
+            new_defects = [i for i in dict.fromkeys(i for d, _, _ in related for i in d) if i not in defects]
+            defects.update(zip(new_defects, executor.map(partial(_fetch_defect, client), new_defects)))
+            new_enhancements = [
+                i for i in dict.fromkeys(i for _, e, _ in related for i in e) if i not in enhancements
+            ]
+            enhancements.update(
+                zip(new_enhancements, executor.map(partial(_fetch_enhancement, client), new_enhancements))
+            )
+            prereqs = _fetch_prerequisite_names(client, list(dict.fromkeys(i for _, _, p in related for i in p)))
+
+            for done, (release, (defect_ids, enhancement_ids, prerequisite_ids)) in enumerate(
+                zip(batch, related), start + 1
+            ):
+                if defect_ids:
+                    release.defects = [d for i in defect_ids if (d := defects[i])]
+                if enhancement_ids:
+                    release.enhancements = [e for i in enhancement_ids if (e := enhancements[i])]
+                if prerequisite_ids:
+                    release.prerequisites = [prereqs[i] for i in prerequisite_ids if i in prereqs]
+                if progress_callback:
+                    progress_callback(f"  Enriched ({done}/{total}) {release.short_description}")
+
+    return releases
+
+
 def get_release_with_details(session: AuthSession, sys_id: str) -> Release:
     """Get release with all defects and enhancements populated.
 
@@ -16,17 +16,43 @@ File type filters (use with filetype_filter parameter):
 - "kb"        -> Knowledge base articles (kb_knowledge)
 """
 
+import base64
+import binascii
+import functools
+import http.cookiejar
+import importlib.util
+import json
+import re
+import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Literal
-from urllib.parse import urlencode
+from typing import TYPE_CHECKING, Any, Literal
 
-import httpx
+import orjson
 
 from .auth import AuthSession
 
+if TYPE_CHECKING:
+    import httpx
+
 SERVICENOW_BASE = "https://elluciansupport.service-now.com"
 COVEO_BASE = "https://platform.cloud.coveo.com"
 
+# Idle connections the shared search client keeps open between queries
+_KEEPALIVE_CONNECTIONS = 20
+
+# Search tokens are reused until this many seconds before their JWT expiry
+_TOKEN_EXPIRY_MARGIN = 60.0
+
+# The token as it appears in the raw portal JSON (JWTs never need escaping)
+_SEARCH_TOKEN_RE = re.compile(rb'"searchToken"\s*:\s*"([^"\\]+)"')
+
+# Seconds a response stays in a caller-supplied search result cache
+RESULT_CACHE_TTL = 300.0
+
+# Cached (token, expiry) per session, keyed by the session's cookies
+_token_cache: dict[frozenset[tuple[str, str]], tuple[str, float]] = {}
+
 # Map friendly names to Coveo @source values
 SOURCE_MAP = {
     "docs": "Zoomin - Ellucian Resources",
@@ -47,11 +73,19 @@ FILETYPE_MAP = {
     "release": "ellucian_product_release",
 }
 
+# Coveo values quoted for filter expressions, built once at import
+_SOURCE_QUOTED = {name: f'"{value}"' for name, value in SOURCE_MAP.items()}
+_FILETYPE_QUOTED = {name: f'"{value}"' for name, value in FILETYPE_MAP.items()}
+
+# Accepted filter names, for validating user input before any network call
+VALID_SOURCES = frozenset(SOURCE_MAP)
+VALID_FILETYPES = frozenset(FILETYPE_MAP)
+
 SourceFilter = Literal["docs", "kb", "defect", "release", "idea", "community", "enhancement"]
 FiletypeFilter = Literal["html", "pdf", "kb", "defect", "release"]
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A single search result."""
 
@@ -84,7 +118,7 @@ class SearchResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResponse:
     """Search results from Coveo."""
 
@@ -111,31 +145,68 @@ class SearchError(Exception):
 
 
 def _find_token(obj: Any, key: str = "searchToken") -> str | None:
-    """Recursively search for a key in nested dict/list structure."""
-    if isinstance(obj, dict):
-        if key in obj:
-            return obj[key]
-        for v in obj.values():
-            result = _find_token(v, key)
-            if result:
-                return result
-    elif isinstance(obj, list):
-        for item in obj:
-            result = _find_token(item, key)
-            if result:
-                return result
+    """Find the first non-empty value for key in a nested dict/list structure.
+
+    Walks breadth-first with an explicit queue, so deeply nested portal
+    responses cost no Python call frames and cannot hit the recursion limit.
+    """
+    queue = deque([obj])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            value = node.get(key)
+            if value:
+                return value
+            queue.extend(node.values())
+        elif isinstance(node, list):
+            queue.extend(node)
     return None
 
 
-def get_search_token(session: AuthSession, client: httpx.Client) -> str:
+@functools.cache
+def _shared_client() -> "httpx.Client":
+    """Process-wide search client, created on first use.
+
+    Connections to ServiceNow and Coveo (and their TLS sessions) stay open
+    between searches instead of being set up again for every query. When
+    the optional h2 package is installed the client negotiates HTTP/2.
+
+    The client is shared by every session, so its cookie jar accepts and
+    sends nothing: each request carries its own session's cookies, and
+    Set-Cookie responses cannot leak into another session's requests.
+    """
+    import httpx
+
+    return httpx.Client(
+        timeout=30.0,
+        cookies=http.cookiejar.CookieJar(http.cookiejar.DefaultCookiePolicy(allowed_domains=[])),
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=_KEEPALIVE_CONNECTIONS),
+    )
+
+
+def _token_expiry(token: str) -> float | None:
+    """Read the exp claim (epoch seconds) from a JWT, or None if unreadable."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+        return None
+
+
+def get_search_token(session: AuthSession, client: "httpx.Client", refresh: bool = False) -> str:
     """Get Coveo search token from ServiceNow.
 
     The token is obtained by requesting the search page data from
-    ServiceNow's Service Portal API.
+    ServiceNow's Service Portal API. Tokens are JWTs valid for hours, so
+    each session's token is cached until shortly before it expires and
+    later searches skip the ServiceNow round-trip.
 
     Args:
         session: Authenticated session with cookies.
         client: HTTP client to use.
+        refresh: Fetch a new token even if a cached one has not expired.
 
     Returns:
         Coveo search token (JWT).
@@ -143,26 +214,50 @@ def get_search_token(session: AuthSession, client: httpx.Client) -> str:
     Raises:
         SearchError: If token cannot be obtained.
     """
-    # Set cookies from session
-    for name, value in session.cookies.items():
-        client.cookies.set(name, value, domain="elluciansupport.service-now.com")
+    cache_key = frozenset(session.cookies.items())
+    cached = _token_cache.get(cache_key)
+    if cached and not refresh and time.time() < cached[1] - _TOKEN_EXPIRY_MARGIN:
+        return cached[0]
+
+    # Send this session's cookies with the request itself, never via the client's jar
+    cookie_header = "; ".join(f"{name}={value}" for name, value in session.cookies.items())
 
     # Request the search page data
-    resp = client.get(f"{SERVICENOW_BASE}/api/now/sp/page?id=csm_coveo_search")
+    resp = client.get(f"{SERVICENOW_BASE}/api/now/sp/page?id=csm_coveo_search", headers={"Cookie": cookie_header})
 
     if resp.status_code != 200:
         logged_in = resp.headers.get("x-is-logged-in", "unknown")
         raise SearchError(f"Failed to get search page (status {resp.status_code}, logged_in={logged_in})")
 
-    data = resp.json()
-    token = _find_token(data)
+    # Scan the raw body for the one key needed, stopping at the first hit,
+    # instead of decoding the whole portal page; walk the parsed JSON only
+    # if the token is not in its plain form
+    match = _SEARCH_TOKEN_RE.search(resp.content)
+    token = match.group(1).decode() if match else _find_token(orjson.loads(resp.content))
 
     if not token:
         raise SearchError("searchToken not found in ServiceNow response")
 
+    expiry = _token_expiry(token)
+    if expiry is not None:
+        _token_cache[cache_key] = (token, expiry)
+
     return token
 
 
+def _filter_clause(field: str, selected: str | list[str] | None, quoted: dict[str, str]) -> str | None:
+    """Build one @field==... clause from friendly filter names; unknown names are skipped."""
+    if not selected:
+        return None
+    names = [selected] if isinstance(selected, str) else selected
+    values = [value for name in names if (value := quoted.get(name))]
+    if not values:
+        return None
+    if len(values) == 1:
+        return f"@{field}=={values[0]}"
+    return f"@{field}==({', '.join(values)})"
+
+
 def _build_filter_query(
     source_filter: SourceFilter | list[SourceFilter] | None = None,
     filetype_filter: FiletypeFilter | list[FiletypeFilter] | None = None,
@@ -176,34 +271,23 @@ def _build_filter_query(
     Returns:
         Coveo aq filter string, or None if no filters.
     """
-    clauses = []
-
-    # Handle source filter
-    if source_filter:
-        sources = [source_filter] if isinstance(source_filter, str) else source_filter
-        source_values = [SOURCE_MAP[s] for s in sources if s in SOURCE_MAP]
-        if source_values:
-            if len(source_values) == 1:
-                clauses.append(f'@source=="{source_values[0]}"')
-            else:
-                quoted = ", ".join(f'"{v}"' for v in source_values)
-                clauses.append(f"@source==({quoted})")
-
-    # Handle filetype filter
-    if filetype_filter:
-        types = [filetype_filter] if isinstance(filetype_filter, str) else filetype_filter
-        type_values = [FILETYPE_MAP[t] for t in types if t in FILETYPE_MAP]
-        if type_values:
-            if len(type_values) == 1:
-                clauses.append(f'@filetype=="{type_values[0]}"')
-            else:
-                quoted = ", ".join(f'"{v}"' for v in type_values)
-                clauses.append(f"@filetype==({quoted})")
-
-    if not clauses:
-        return None
+    clauses = (
+        _filter_clause("source", source_filter, _SOURCE_QUOTED),
+        _filter_clause("filetype", filetype_filter, _FILETYPE_QUOTED),
+    )
+    return " AND ".join(filter(None, clauses)) or None
 
-    return " AND ".join(clauses)
+
+def _post_search(client: "httpx.Client", token: str, params: dict[str, Any]) -> "httpx.Response":
+    """POST a query to the Coveo search API; httpx form-encodes params and sets the Content-Type."""
+    return client.post(
+        f"{COVEO_BASE}/rest/search/v2?organizationId=ellucian",
+        data=params,
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Accept": "*/*",
+        },
+    )
 
 
 def search(
@@ -213,6 +297,8 @@ def search(
     first_result: int = 0,
     source_filter: SourceFilter | list[SourceFilter] | None = None,
     filetype_filter: FiletypeFilter | list[FiletypeFilter] | None = None,
+    client: "httpx.Client | None" = None,
+    result_cache: dict[tuple, tuple[float, SearchResponse]] | None = None,
 ) -> SearchResponse:
     """Search the Ellucian Support Center.
 
@@ -226,6 +312,11 @@ def search(
                       or list for OR.
         filetype_filter: Filter by type - "html", "pdf", "kb", "defect",
                         "release". Can be single value or list for OR.
+        client: HTTP client to use; defaults to a shared client whose
+                connections are reused across searches.
+        result_cache: Optional dict owned by the caller; repeat queries
+                      within RESULT_CACHE_TTL seconds are answered from it
+                      without contacting Coveo.
 
     Returns:
         SearchResponse with results.
@@ -243,39 +334,48 @@ def search(
         # Search only PDFs
         search(session, "installation guide", filetype_filter="pdf")
     """
-    with httpx.Client(timeout=30.0) as client:
-        # Get search token
-        token = get_search_token(session, client)
-
-        # Build search request
-        search_params = {
-            "q": query,
-            "searchHub": "CustomerCenter_MainSearch",
-            "locale": "en",
-            "firstResult": first_result,
-            "numberOfResults": min(num_results, 50),
-            "excerptLength": 200,
-            "enableDidYouMean": "true",
-            "sortCriteria": "relevancy",
-        }
-
-        # Add filters if specified
-        aq = _build_filter_query(source_filter, filetype_filter)
-        if aq:
-            search_params["aq"] = aq
-
-        # Execute search against Coveo
-        resp = client.post(
-            f"{COVEO_BASE}/rest/search/v2?organizationId=ellucian",
-            data=urlencode(search_params),
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-                "Accept": "*/*",
-            },
-        )
+    # Filters (if specified) are part of both the request and the cache key
+    aq = _build_filter_query(source_filter, filetype_filter)
+
+    cache_key = (query, min(num_results, 50), first_result, aq, frozenset(session.cookies.items()))
+    if result_cache is not None:
+        cached = result_cache.get(cache_key)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
+    if client is None:
+        client = _shared_client()
+
+    # Get search token
+    token = get_search_token(session, client)
+
+    # Build search request
+    search_params = {
+        "q": query,
+        "searchHub": "CustomerCenter_MainSearch",
+        "locale": "en",
+        "firstResult": first_result,
+        "numberOfResults": min(num_results, 50),
+        "excerptLength": 200,
+        "enableDidYouMean": "true",
+        "sortCriteria": "relevancy",
+    }
+
+    if aq:
+        search_params["aq"] = aq
+
+    # Execute search against Coveo
+    resp = _post_search(client, token, search_params)
+
+    # A cached token can be revoked before its expiry; fetch a new one once
+    if resp.status_code == 401:
+        token = get_search_token(session, client, refresh=True)
+        resp = _post_search(client, token, search_params)
 
-        if resp.status_code != 200:
-            raise SearchError(f"Coveo search failed (status {resp.status_code}): {resp.text[:200]}")
+    if resp.status_code != 200:
+        raise SearchError(f"Coveo search failed (status {resp.status_code}): {resp.text[:200]}")
 
-        return SearchResponse.from_coveo(resp.json(), query)
+    response = SearchResponse.from_coveo(resp.json(), query)
+    if result_cache is not None:
+        result_cache[cache_key] = (time.monotonic() + RESULT_CACHE_TTL, response)
+    return response
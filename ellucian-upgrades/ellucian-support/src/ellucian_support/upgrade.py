@@ -4,22 +4,30 @@ Orchestrates gathering all release data for a quarterly upgrade round,
 grouping by module and filtering out irrelevant releases.
 """
 
+import functools
+import io
 import json
 import re
 from dataclasses import dataclass, field
-from typing import Any
+from html import escape
+from itertools import chain
+from types import MappingProxyType
+from typing import IO, Any
 
 from .auth import AuthSession
 from .release import (
     BANNER_PRODUCT_LINE_ID,
     Release,
-    enrich_release,
+    enrich_releases,
     query_releases,
 )
 
-# ESM product name → ServiceNow module name
+# ServiceNow requests in flight at once while enriching releases
+_ENRICH_WORKERS = 8
+
+# ESM product name → ServiceNow module name (read-only)
 # Seeded from ESM PROD product list + Winter 2025 FHDA page
-ESM_TO_MODULE = {
+ESM_TO_MODULE = MappingProxyType({
     "General DB": "BA GENERAL CMN DB",
     "Accounts Receivable": "Banner Accounts Receivable",
     "Application Navigator": "BA GEN AppNav",
@@ -41,10 +49,10 @@ ESM_TO_MODULE = {
     "CAL-B Financial Aid": "BA CALBHR",
     "Document Management API": "Banner Document Management API",
     "Event Publisher DB": "Banner Event Publisher DB",
-}
+})
 
-# Reverse mapping: ServiceNow module name → ESM product name
-MODULE_TO_ESM = {v: k for k, v in ESM_TO_MODULE.items()}
+# Reverse mapping: ServiceNow module name → ESM product name (read-only)
+MODULE_TO_ESM = MappingProxyType({v: k for k, v in ESM_TO_MODULE.items()})
 
 
 def match_installed_versions(
@@ -63,6 +71,14 @@ def match_installed_versions(
     """
     round_module_names = {m.name for m in round_.modules}
     result = {}
+    if len(esm_versions) > len(round_module_names):
+        # ESM usually lists more products than a round has modules: walk the
+        # smaller side and look each module up in the reverse map
+        for module_name in round_module_names:
+            esm_name = MODULE_TO_ESM.get(module_name)
+            if esm_name and (version := esm_versions.get(esm_name)) is not None:
+                result[module_name] = version
+        return result
     for esm_name, version in esm_versions.items():
         module_name = ESM_TO_MODULE.get(esm_name)
         if module_name and module_name in round_module_names:
@@ -76,10 +92,25 @@ EXCLUDE_PATTERNS = [
     "Canada", "Canadian", "Banner in Experience", "PRINT APP",
 ]
 
+# All exclusion patterns as one case-insensitive alternation, matched in a single scan
+_EXCLUDE_RE = re.compile("|".join(map(re.escape, EXCLUDE_PATTERNS)), re.IGNORECASE)
+
+_TAX_UPDATE_MODULE = "BA HR Tax Update"
+
+# Release name patterns, compiled once for the per-release grouping loop
+_TAX_RE = re.compile(r"^(BA HR Tax Update)\s+#(\d+)")
+_REPOST_RE = re.compile(r"\s+-\s+REPOST$")
+# Every trailing whitespace-separated token that starts with a digit ("9.3.57", "8.55 1")
+_VERSION_SUFFIX_RE = re.compile(r"(?:(?:^|\s+)\d\S*)+$")
 
+
+@functools.lru_cache(maxsize=4096)
 def parse_module_name(short_description: str) -> str:
     """Extract module name from short_description by removing version suffix.
 
+    Results are cached per description, so repeated release names (across
+    rounds, or reposts within one) are parsed only once.
+
     Examples:
         "BA FIN AID 9.3.57" → "BA FIN AID"
         "BA GENERAL CMN DB 9.41" → "BA GENERAL CMN DB"
@@ -89,32 +120,44 @@ def parse_module_name(short_description: str) -> str:
     """
     desc = short_description.strip()
     # Special case: "BA HR Tax Update #NNN" → "BA HR Tax Update"
-    m = re.match(r"^(BA HR Tax Update)\s+#\d+", desc)
+    m = _TAX_RE.match(desc)
     if m:
         return m.group(1)
     # Strip trailing annotations like "- REPOST" before version parsing
-    desc = re.sub(r"\s+-\s+REPOST$", "", desc)
-    # Strip the version suffix: last token(s) that start with a digit
-    # Walk backwards through space-separated tokens, dropping version parts
-    parts = desc.split()
-    while parts and re.match(r"^\d", parts[-1]):
-        parts.pop()
-    return " ".join(parts) if parts else short_description
+    desc = _REPOST_RE.sub("", desc)
+    # Strip the version suffix: last token(s) that start with a digit, in one anchored match
+    name = _VERSION_SUFFIX_RE.sub("", desc)
+    # Collapse any inner whitespace runs so names group the same however they were typed
+    return " ".join(name.split()) if name else short_description
 
 
 def should_exclude(short_description: str) -> bool:
     """Check if a release should be excluded based on name patterns."""
-    desc_lower = short_description.lower()
-    return any(pat.lower() in desc_lower for pat in EXCLUDE_PATTERNS)
+    return _EXCLUDE_RE.search(short_description) is not None
 
 
-@dataclass
+@functools.lru_cache(maxsize=1024)
+def _escape_name(name: str) -> str:
+    """HTML-escape a module name; the same few names recur on every page."""
+    return escape(name)
+
+
+@dataclass(slots=True)
 class UpgradeModule:
     """A module (e.g. 'BA FIN AID') with its releases for this upgrade round."""
 
     name: str
     releases: list[Release] = field(default_factory=list)
 
+    @property
+    def escaped_name(self) -> str:
+        """HTML-escaped module name, shared by every rendered page.
+
+        Memoized by name rather than on the instance, so renaming a module
+        can never leave a stale value behind.
+        """
+        return _escape_name(self.name)
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "name": self.name,
@@ -129,7 +172,7 @@ class UpgradeModule:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class UpgradeRound:
     """Complete data for one upgrade round."""
 
@@ -147,7 +190,41 @@ class UpgradeRound:
         }
 
     def to_json(self, indent: int = 2) -> str:
-        return json.dumps(self.to_dict(), indent=indent)
+        buf = io.StringIO()
+        self.write_json(buf, indent=indent)
+        return buf.getvalue()
+
+    def write_json(self, fp: IO[str], indent: int | None = 2) -> None:
+        """Write the round as JSON to fp, one module at a time.
+
+        The output is exactly what json.dumps(self.to_dict()) produces, but
+        only one module's dict is built and held in memory at once.
+        """
+        header = json.dumps(
+            {"title": self.title, "cutoff_date": self.cutoff_date, "since_date": self.since_date, "modules": []},
+            indent=indent,
+        )
+        # "modules" is the last key, so its empty list is the last "[]" in the header
+        head, tail = header.rsplit("[]", 1)
+        fp.write(head)
+        if not self.modules:
+            fp.write("[]")
+        elif indent is None:
+            fp.write("[")
+            for i, module in enumerate(self.modules):
+                if i:
+                    fp.write(", ")
+                fp.write(json.dumps(module.to_dict()))
+            fp.write("]")
+        else:
+            # Modules sit two levels deep; JSON strings never contain a raw newline
+            newline = "\n" + " " * (2 * indent)
+            fp.write("[")
+            for i, module in enumerate(self.modules):
+                fp.write("," + newline if i else newline)
+                fp.write(json.dumps(module.to_dict(), indent=indent).replace("\n", newline))
+            fp.write("\n" + " " * indent + "]")
+        fp.write(tail)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "UpgradeRound":
@@ -163,30 +240,34 @@ class UpgradeRound:
         return cls.from_dict(json.loads(json_str))
 
 
+def _date_key(release: Release) -> str:
+    """Sort key: target_ga_date, falling back to date_released."""
+    return release.target_ga_date or release.date_released or ""
+
+
+def _tax_key(release: Release) -> tuple[int, str]:
+    """Sort key for tax updates: update number, then date for equal numbers."""
+    m = _TAX_RE.match(release.short_description.strip())
+    return (int(m.group(2)) if m else 0, _date_key(release))
+
+
 def _group_releases(releases: list[Release]) -> list[UpgradeModule]:
     """Group releases by module name, preserving encounter order."""
+    # Dicts keep insertion order, so the first release seen fixes each module's position
     modules: dict[str, UpgradeModule] = {}
-    order: list[str] = []
 
     for release in releases:
         name = parse_module_name(release.short_description)
-        if name not in modules:
-            modules[name] = UpgradeModule(name=name)
-            order.append(name)
-        modules[name].releases.append(release)
+        mod = modules.get(name)
+        if mod is None:
+            mod = modules[name] = UpgradeModule(name=name)
+        mod.releases.append(release)
 
-    # Sort releases within each module by date (target_ga_date or date_released)
+    # Sort releases within each module by date, or tax updates by update number
     for mod in modules.values():
-        mod.releases.sort(key=lambda r: r.target_ga_date or r.date_released or "")
+        mod.releases.sort(key=_tax_key if mod.name == _TAX_UPDATE_MODULE else _date_key)
 
-    # Special sort for tax updates: sort by update number
-    for mod in modules.values():
-        if mod.name == "BA HR Tax Update":
-            mod.releases.sort(
-                key=lambda r: int(m.group(1)) if (m := re.search(r"#(\d+)", r.short_description)) else 0
-            )
-
-    return [modules[name] for name in order]
+    return list(modules.values())
 
 
 def gather_upgrade_round(
@@ -197,6 +278,7 @@ def gather_upgrade_round(
     enrich: bool = True,
     product_line_id: str = BANNER_PRODUCT_LINE_ID,
     progress_callback=None,
+    concurrency: int = _ENRICH_WORKERS,
 ) -> UpgradeRound:
     """Gather all release data for an upgrade round.
 
@@ -215,14 +297,15 @@ def gather_upgrade_round(
         enrich: Whether to fetch defects/enhancements/prerequisites.
         product_line_id: ServiceNow product line sys_id.
         progress_callback: Optional callable(message: str) for progress updates.
+        concurrency: Maximum number of ServiceNow requests in flight while enriching.
+            Kept modest so ServiceNow is not flooded with parallel requests.
 
     Returns:
         UpgradeRound with grouped, filtered modules.
     """
 
-    def _log(msg: str):
-        if progress_callback:
-            progress_callback(msg)
+    # Resolve the callback once so each progress message is a plain call
+    _log = progress_callback or (lambda msg: None)
 
     # Query 1: Upcoming releases (not yet released)
     upcoming_query = (
@@ -236,8 +319,7 @@ def gather_upgrade_round(
     _log(f"  Found {len(upcoming)} upcoming releases")
 
     # Query 2: Recently released (already shipped)
-    all_releases = {r.sys_id: r for r in upcoming}
-
+    recent: list[Release] = []
     if since_date:
         recent_query = (
             f"date_released>={since_date}"
@@ -248,25 +330,25 @@ def gather_upgrade_round(
         recent = query_releases(session, recent_query)
         _log(f"  Found {len(recent)} recent releases")
 
-        # Merge, dedup by sys_id
-        for r in recent:
-            if r.sys_id not in all_releases:
-                all_releases[r.sys_id] = r
-
-    # Filter excluded patterns
-    filtered = [
-        r for r in all_releases.values() if not should_exclude(r.short_description)
-    ]
-    excluded_count = len(all_releases) - len(filtered)
+    # Merge, dedup by sys_id and filter excluded patterns in one pass
+    seen: set[str] = set()
+    filtered: list[Release] = []
+    excluded_count = 0
+    for r in chain(upcoming, recent):
+        if r.sys_id in seen:
+            continue
+        seen.add(r.sys_id)
+        if should_exclude(r.short_description):
+            excluded_count += 1
+        else:
+            filtered.append(r)
     if excluded_count:
         _log(f"  Excluded {excluded_count} releases (SaaS/Europe/Australia/Texas/UK)")
 
     # Enrich with defects/enhancements/prerequisites
     if enrich:
-        total = len(filtered)
-        for i, release in enumerate(filtered, 1):
-            _log(f"  Enriching ({i}/{total}) {release.short_description}...")
-            enrich_release(session, release)
+        _log(f"  Enriching {len(filtered)} releases...")
+        enrich_releases(session, filtered, concurrency=concurrency, progress_callback=_log)
 
     # Group by module
     modules = _group_releases(filtered)
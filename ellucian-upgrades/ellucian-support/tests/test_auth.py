@@ -0,0 +1,39 @@
+"""Tests for auth.py — session persistence."""
+
+from ellucian_support.auth import AuthSession
+
+
+class TestAuthSessionLoad:
+    def test_missing_file(self, tmp_path):
+        assert AuthSession.load(tmp_path / "cookies.json") is None
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "cookies.json"
+        AuthSession(cookies={"a": "1"}, glide_session_store="gss").save(path)
+        session = AuthSession.load(path)
+        assert session.cookies == {"a": "1"}
+        assert session.is_authenticated
+
+    def test_reuses_cached_session(self, tmp_path):
+        path = tmp_path / "cookies.json"
+        AuthSession(glide_session_store="gss").save(path)
+        assert AuthSession.load(path) is AuthSession.load(path)
+
+    def test_reloads_after_save(self, tmp_path):
+        path = tmp_path / "cookies.json"
+        AuthSession(glide_session_store="old").save(path)
+        AuthSession.load(path)
+        AuthSession(glide_session_store="new").save(path)
+        assert AuthSession.load(path).glide_session_store == "new"
+
+    def test_clear(self, tmp_path):
+        path = tmp_path / "cookies.json"
+        AuthSession(glide_session_store="gss").save(path)
+        AuthSession.load(path)
+        AuthSession.clear(path)
+        assert AuthSession.load(path) is None
+
+    def test_invalid_json(self, tmp_path):
+        path = tmp_path / "cookies.json"
+        path.write_text("{not json")
+        assert AuthSession.load(path) is None
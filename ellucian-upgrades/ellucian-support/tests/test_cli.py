@@ -0,0 +1,24 @@
+"""Tests for cli.py helpers."""
+
+import pytest
+
+from ellucian_support.cli import _format_size
+
+
+class TestFormatSize:
+    @pytest.mark.parametrize(
+        ("size", "expected"),
+        [
+            (0, "0 B"),
+            (1024, "1024 B"),
+            (1025, "1.0 KB"),
+            # Exact halves round to even, as float formatting does
+            (1280, "1.2 KB"),
+            (1792, "1.8 KB"),
+            (1331, "1.3 KB"),
+            (1382, "1.3 KB"),
+            (1048576, "1024.0 KB"),
+        ],
+    )
+    def test_boundaries(self, size, expected):
+        assert _format_size(size) == expected
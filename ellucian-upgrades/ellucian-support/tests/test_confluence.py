@@ -1,17 +1,24 @@
 """Tests for confluence.py — XML rendering and page publishing."""
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 
 from ellucian_support.confluence import (
     ConfluenceError,
+    _confluence_headers,
     _detail_page_title,
     _format_date,
     _release_type_label,
     _version_from_short_desc,
     compute_client_status,
+    compute_client_statuses,
+    confluence_client,
     create_page,
+    precompute_module_facts,
+    publish_upgrade_round,
     render_client_page,
     render_detail_page,
     render_root_page,
@@ -198,6 +205,16 @@ class TestRenderRootPage:
         # Module name should appear in first row, empty <p /> in second
         assert html.count("<p>BA FIN AID</p>") == 1  # Module name once in Details
 
+    def test_synopsis_reflects_current_modules(self):
+        round_ = self._make_round()
+        render_root_page(round_)
+        round_.modules.append(UpgradeModule(name="BA A&B"))
+
+        html = render_root_page(round_)
+
+        synopsis = html.split("Modules included: ", 1)[1].split("</p>", 1)[0]
+        assert synopsis.endswith(", BA A&amp;B")
+
 
 # --- Detail page rendering tests ---
 
@@ -279,12 +296,27 @@ class TestRenderDetailPage:
         html = render_detail_page(self._make_module())
         assert "<p>9.3.57</p>" in html
 
+    def test_summary_text_escaping(self):
+        mod = UpgradeModule(
+            name="BA TEST",
+            releases=[
+                Release(
+                    sys_id="a",
+                    number="PR1",
+                    short_description="BA TEST 1.0",
+                    defects=[Defect(sys_id="d1", number="PD1", summary='Fix "<b>" & \'x\'')],
+                ),
+            ],
+        )
+        html = render_detail_page(mod)
+        assert "<p>Fix \"&lt;b&gt;\" &amp; 'x'</p>" in html
+
 
 # --- API tests ---
 
 
 class TestCreatePage:
-    @patch("ellucian_support.confluence.httpx.Client")
+    @patch("httpx.Client")
     def test_success(self, mock_client_cls):
         mock_client = MagicMock()
         mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
@@ -306,8 +338,11 @@ class TestCreatePage:
 
         assert result["id"] == "12345"
         mock_client.post.assert_called_once()
+        payload = orjson.loads(mock_client.post.call_args.kwargs["content"])
+        assert payload["title"] == "Test Page"
+        assert payload["body"] == {"representation": "storage", "value": "<p>body</p>"}
 
-    @patch("ellucian_support.confluence.httpx.Client")
+    @patch("httpx.Client")
     def test_failure_raises(self, mock_client_cls):
         mock_client = MagicMock()
         mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
@@ -315,15 +350,202 @@ class TestCreatePage:
 
         mock_resp = MagicMock()
         mock_resp.status_code = 400
-        mock_resp.text = "Bad Request"
+        mock_resp.content = b"Bad Request"
         mock_client.post.return_value = mock_resp
 
-        with pytest.raises(ConfluenceError, match="HTTP 400"):
+        with pytest.raises(ConfluenceError, match="HTTP 400 — Bad Request"):
             create_page(
                 "Test", "space", "parent",
                 "<p>body</p>", "user", "token", "test.atlassian.net",
             )
 
+    @patch("ellucian_support.confluence.time.sleep")
+    def test_retries_rate_limited(self, mock_sleep):
+        client = MagicMock()
+        limited = MagicMock(status_code=429, headers={"Retry-After": "3"})
+        ok = MagicMock(status_code=201)
+        ok.json.return_value = {"id": "1"}
+        client.post.side_effect = [limited, ok]
+
+        result = create_page(
+            "Test", "space", "parent",
+            "<p>body</p>", "user", "token", "test.atlassian.net", client=client,
+        )
+
+        assert result["id"] == "1"
+        assert client.post.call_count == 2
+        mock_sleep.assert_called_once_with(3.0)
+
+    @pytest.mark.parametrize("retry_after", ["nan", "inf", "-inf", "soon"])
+    @patch("ellucian_support.confluence.random.random", return_value=0.5)
+    @patch("ellucian_support.confluence.time.sleep")
+    def test_unusable_retry_after_uses_backoff(self, mock_sleep, mock_random, retry_after):
+        client = MagicMock()
+        limited = MagicMock(status_code=429, headers={"Retry-After": retry_after})
+        ok = MagicMock(status_code=201)
+        ok.json.return_value = {"id": "1"}
+        client.post.side_effect = [limited, ok]
+
+        result = create_page(
+            "Test", "space", "parent",
+            "<p>body</p>", "user", "token", "test.atlassian.net", client=client,
+        )
+
+        assert result["id"] == "1"
+        mock_sleep.assert_called_once_with(1.5)
+
+    @patch("ellucian_support.confluence.time.sleep")
+    def test_gives_up_after_retries(self, mock_sleep):
+        client = MagicMock()
+        client.post.return_value = MagicMock(status_code=502, headers={}, content=b"Bad Gateway")
+
+        with pytest.raises(ConfluenceError, match="HTTP 502"):
+            create_page(
+                "Test", "space", "parent",
+                "<p>body</p>", "user", "token", "test.atlassian.net", client=client,
+            )
+
+        assert client.post.call_count == 5
+        assert mock_sleep.call_count == 4
+
+    @patch("httpx.Client")
+    def test_reuses_passed_client(self, mock_client_cls):
+        client = MagicMock()
+        mock_resp = MagicMock()
+        mock_resp.status_code = 201
+        mock_resp.json.return_value = {"id": "1"}
+        client.post.return_value = mock_resp
+
+        create_page(
+            "Test", "space", "parent",
+            "<p>body</p>", "user", "token", "test.atlassian.net", client=client,
+        )
+
+        client.post.assert_called_once()
+        mock_client_cls.assert_not_called()
+
+
+class TestConfluenceClient:
+    @pytest.mark.parametrize("available", [True, False])
+    @patch("httpx.Client")
+    def test_http2_only_when_h2_installed(self, mock_client_cls, available):
+        with patch("ellucian_support.confluence._http2_available", return_value=available):
+            confluence_client("user", "token")
+        assert mock_client_cls.call_args.kwargs["http2"] is available
+
+    def test_auth_headers_cached_and_read_only(self):
+        headers = _confluence_headers("user", "token")
+        assert headers is _confluence_headers("user", "token")
+        assert headers["Authorization"] == "Basic dXNlcjp0b2tlbg=="
+        with pytest.raises(TypeError):
+            headers["Authorization"] = "changed"
+
+
+class TestPublishUpgradeRound:
+    @patch("httpx.Client")
+    def test_single_client_for_all_calls(self, mock_client_cls):
+        mock_client = MagicMock()
+        mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
+        mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
+
+        created = iter(range(100))
+
+        def _post(url, content):
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.json.return_value = {"id": str(next(created)), "_links": {"tinyui": "/x/A"}}
+            return resp
+
+        mock_client.post.side_effect = _post
+        put_resp = MagicMock()
+        put_resp.status_code = 200
+        put_resp.json.return_value = {"_links": {"tinyui": "/x/R"}}
+        mock_client.put.return_value = put_resp
+
+        round_ = UpgradeRound(
+            title="Spring 2026",
+            cutoff_date="2026-03-19",
+            modules=[
+                UpgradeModule(name="BA FIN AID", releases=[
+                    Release(sys_id="a", number="PR1", short_description="BA FIN AID 9.3.57"),
+                ]),
+                UpgradeModule(name="BA GENERAL", releases=[
+                    Release(sys_id="b", number="PR2", short_description="BA GENERAL 8.26"),
+                ]),
+            ],
+        )
+        result = publish_upgrade_round(round_, "space", "parent", "user", "token", "test.atlassian.net")
+
+        mock_client_cls.assert_called_once()
+        assert mock_client_cls.call_args.kwargs["headers"]["Authorization"].startswith("Basic ")
+        assert mock_client.post.call_count == 3
+        assert mock_client.put.call_count == 1
+        assert result["root_page"]["url"] == "https://test.atlassian.net/wiki/x/R"
+        assert [d["url"] for d in result["detail_pages"]] == ["https://test.atlassian.net/wiki/x/A"] * 2
+
+    @patch("httpx.Client")
+    def test_detail_pages_keep_module_order(self, mock_client_cls):
+        mock_client = MagicMock()
+        mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
+        mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
+
+        def _post(url, content):
+            title = orjson.loads(content)["title"]
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.json.return_value = {"id": title, "_links": {"tinyui": f"/x/{title}"}}
+            return resp
+
+        mock_client.post.side_effect = _post
+        put_resp = MagicMock()
+        put_resp.status_code = 200
+        put_resp.json.return_value = {"_links": {}}
+        mock_client.put.return_value = put_resp
+
+        names = [f"BA MOD{i:02d}" for i in range(20)]
+        round_ = UpgradeRound(
+            title="Spring 2026",
+            cutoff_date="2026-03-19",
+            modules=[
+                UpgradeModule(name=n, releases=[
+                    Release(sys_id=n, number="PR", short_description=f"{n} 1.0"),
+                ])
+                for n in names
+            ],
+        )
+        messages = []
+        result = publish_upgrade_round(
+            round_, "space", "parent", "user", "token", "test.atlassian.net",
+            progress_callback=messages.append,
+        )
+
+        assert [d["id"] for d in result["detail_pages"]] == [f"{n} 1.0" for n in names]
+        created = [m for m in messages if "Created detail page" in m]
+        assert len(created) == 20
+        assert created[-1].startswith("  Created detail page (20/20)")
+
+    @patch("httpx.Client")
+    def test_concurrency_bounds_pool(self, mock_client_cls):
+        mock_client = MagicMock()
+        mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
+        mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.json.return_value = {"id": "1", "_links": {}}
+        mock_client.post.return_value = resp
+        mock_client.put.return_value = resp
+
+        round_ = UpgradeRound(title="Spring 2026", cutoff_date="2026-03-19", modules=[
+            UpgradeModule(name="BA FIN AID", releases=[
+                Release(sys_id="a", number="PR1", short_description="BA FIN AID 9.3.57"),
+            ]),
+        ])
+        with patch("ellucian_support.confluence.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool_cls:
+            publish_upgrade_round(round_, "space", "parent", "user", "token", "test.atlassian.net", concurrency=2)
+
+        assert pool_cls.call_args.kwargs["max_workers"] == 2
+        assert mock_client_cls.call_args.kwargs["limits"].max_connections == 2
+
 
 # --- Client page rendering tests ---
 
@@ -647,6 +869,55 @@ class TestComputeClientStatus:
         assert status["weighted_score"] == 15
         assert status["color"] == "red"
 
+    def test_precomputed_module_facts_match(self):
+        """Passing precomputed module facts gives the same status."""
+        round_ = UpgradeRound(
+            title="Test", cutoff_date="2026-01-01",
+            modules=[
+                UpgradeModule(name="BA FIN AID", releases=[
+                    Release(sys_id="a", number="PR1", short_description="BA FIN AID 9.3.56",
+                            release_purpose="regulatory"),
+                    Release(sys_id="b", number="PR2", short_description="BA FIN AID 9.3.57",
+                            defects=[Defect(sys_id="d1", number="PD1", summary="fix")]),
+                ]),
+                UpgradeModule(name="BA HR", releases=[]),
+            ],
+        )
+        installed = {"BA FIN AID": "9.3.55", "BA HR": "8.33"}
+        facts = precompute_module_facts(round_)
+        assert facts == {"BA FIN AID": ("9.3.57", 3, "Defect")}
+        assert compute_client_status(round_, installed, {}, module_facts=facts) == \
+            compute_client_status(round_, installed, {})
+
+    def test_batch_matches_per_client(self):
+        """compute_client_statuses gives the same result as one call per client."""
+        round_ = UpgradeRound(
+            title="Test", cutoff_date="2026-01-01",
+            modules=[
+                UpgradeModule(name="BA FIN AID", releases=[
+                    Release(sys_id="a", number="PR1", short_description="BA FIN AID 9.3.57",
+                            release_purpose="regulatory"),
+                ]),
+                UpgradeModule(name="BA HR", releases=[
+                    Release(sys_id="b", number="PR2", short_description="BA HR 8.34"),
+                ]),
+            ],
+        )
+        links = {"BA FIN AID": "https://x/a"}
+        clients = [
+            {"client_name": "A", "installed_versions": {"BA FIN AID": "9.3.56", "BA HR": "8.34"}},
+            {"client_name": "B", "client_page_url": "https://x/b",
+             "installed_versions": {"BA HR": "8.33"}},
+        ]
+        statuses = compute_client_statuses(round_, clients, links)
+        assert statuses == [
+            compute_client_status(round_, c["installed_versions"], links,
+                                  client_page_url=c.get("client_page_url", ""),
+                                  client_name=c["client_name"])
+            for c in clients
+        ]
+        assert [s["weighted_score"] for s in statuses] == [3, 1]
+
 
 class TestRenderStatusPage:
     def _make_statuses(self):
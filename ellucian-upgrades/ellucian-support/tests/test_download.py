@@ -0,0 +1,344 @@
+"""Tests for download.py — FlexNet page parsing."""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ellucian_support.download import (
+    DownloadCenterError,
+    DownloadFile,
+    DownloadPackage,
+    FlexNetClient,
+    _batched,
+    _size_bytes,
+    _write_batch,
+)
+
+PRODUCTS_HTML = """
+<html><body><table>
+<tr><td><a href="/flexnet/operationsportal/downloadPackageVersions.action?lineId=Ellucian-Ethos-Identity&amp;orgId=001G"
+    class="product">Ellucian Ethos Identity</a></td></tr>
+<tr><td><a href="/flexnet/operationsportal/downloadPackageVersions.action?lineId=Banner-Student&amp;orgId=001G">
+    Banner Student &amp; Registration </a></td></tr>
+<tr><td><a href="/flexnet/operationsportal/downloadPackageVersions.action?lineId=Ellucian-Ethos-Identity&amp;orgId=002G"
+    >Ellucian Ethos Identity (again)</a></td></tr>
+<tr><td><a href="/flexnet/operationsportal/other.action?lineId=Nope&amp;orgId=001G">Nope</a></td></tr>
+</table></body></html>
+"""
+
+PACKAGES_HTML = """
+<html><body><table>
+<tr>
+  <td><a href="/flexnet/operationsportal/entitledDownloadFile.action?downloadPkgId=Ellucian+-+Ethos+5.10&amp;orgId=001G"
+      >Ellucian - Ethos 5.10</a></td>
+  <td>Identity release</td>
+  <td>Mar 19, 2026</td>
+</tr>
+<tr>
+  <td><a href="/flexnet/operationsportal/entitledDownloadFile.action?downloadPkgId=Ethos%20Identity%205.9&orgId="
+      >Ethos Identity 5.9</a></td>
+  <td>Jan 2, 2026</td>
+</tr>
+</table></body></html>
+"""
+
+FILES_HTML = """
+<html><body><table>
+<tr>
+  <td><a href="https://download.flexnetoperations.com/123/identity-5.10.zip?a=1&amp;b=2" class="download-link"
+      >identity-5.10.zip</a></td>
+  <td>250.5 MB</td>
+</tr>
+<tr>
+  <td><a href="https://download.flexnetoperations.com/124/readme.txt" class="download-link">readme.txt</a></td>
+  <td>4 KB</td>
+</tr>
+<tr>
+  <td><a href="https://example.com/not-a-download" class="download-link">elsewhere.zip</a></td>
+  <td>1 KB</td>
+</tr>
+</table></body></html>
+"""
+
+SAML_HTML = """
+<html><body>
+<form id="search" action="/search"><input name="q" value=""></form>
+<form id="appForm" method="POST" action="https://ellucian.flexnetoperations.com/flexnet/saml/SSO?a=1&amp;b=2">
+  <input name="SAMLResponse" type="hidden" value="PHNhbWw+&#x2b;Zm9v"/>
+  <input name="RelayState" type="hidden" value="state&amp;more"/>
+</form>
+</body></html>
+"""
+
+
+def _client_for(html: str) -> FlexNetClient:
+    client = FlexNetClient(MagicMock())
+    client._authenticated = True
+    client._client = MagicMock()
+    client._client.get.return_value = MagicMock(status_code=200, text=html)
+    return client
+
+
+class TestAuthenticate:
+    @patch("httpx.Client")
+    def test_posts_saml_form(self, mock_client_cls):
+        http = mock_client_cls.return_value
+        http.get.return_value = MagicMock(status_code=200, text=SAML_HTML)
+        http.post.return_value = MagicMock(status_code=200)
+        client = FlexNetClient(MagicMock(cookies={}))
+
+        client._ensure_authenticated()
+
+        assert http.post.call_args.args == ("https://ellucian.flexnetoperations.com/flexnet/saml/SSO?a=1&b=2",)
+        assert http.post.call_args.kwargs["data"] == {"SAMLResponse": "PHNhbWw++Zm9v", "RelayState": "state&more"}
+        assert http.post.call_args.kwargs["follow_redirects"] is True
+        http.get.assert_called_once()
+        assert client._authenticated
+
+    @patch("httpx.Client")
+    def test_missing_saml_response(self, mock_client_cls):
+        mock_client_cls.return_value.get.return_value = MagicMock(status_code=200, text="<html>Sign in</html>")
+        client = FlexNetClient(MagicMock(cookies={}))
+
+        with pytest.raises(DownloadCenterError, match="SAML"):
+            client._ensure_authenticated()
+
+
+class TestListProducts:
+    def test_extracts_unique_products(self):
+        products = _client_for(PRODUCTS_HTML).list_products()
+        assert products == [
+            ("Ellucian-Ethos-Identity", "Ellucian Ethos Identity"),
+            ("Banner-Student", "Banner Student & Registration"),
+        ]
+
+    def test_product_list_reused(self):
+        client = _client_for(PRODUCTS_HTML)
+
+        assert client.search_products("ethos") == [("Ellucian-Ethos-Identity", "Ellucian Ethos Identity")]
+        assert client.search_products("banner") == [("Banner-Student", "Banner Student & Registration")]
+        assert client._client.get.call_count == 1
+
+
+class TestProductPackages:
+    def test_parses_packages_and_dates(self):
+        packages = _client_for(PACKAGES_HTML).get_product_packages("Ellucian-Ethos-Identity")
+        assert packages == [
+            DownloadPackage(
+                name="Ellucian - Ethos 5.10",
+                description="Ellucian - Ethos 5.10",
+                date_available="Mar 19, 2026",
+                download_pkg_id="Ellucian - Ethos 5.10",
+                org_id="001G",
+            ),
+            DownloadPackage(
+                name="Ethos Identity 5.9",
+                description="Ethos Identity 5.9",
+                date_available="Jan 2, 2026",
+                download_pkg_id="Ethos Identity 5.9",
+                org_id="",
+            ),
+        ]
+
+    def test_archived_after_new(self):
+        archive_html = PACKAGES_HTML.replace("5.10", "4.0").replace("5.9", "3.9")
+        client = _client_for(PACKAGES_HTML)
+        pages = {"new": PACKAGES_HTML, "archive": archive_html}
+        client._client.get.side_effect = lambda url, params: MagicMock(status_code=200, text=pages[params["datatype"]])
+
+        packages = client.get_product_packages("Ellucian-Ethos-Identity", include_archived=True)
+
+        assert [p.name for p in packages] == [
+            "Ellucian - Ethos 5.10", "Ethos Identity 5.9", "Ellucian - Ethos 4.0", "Ethos Identity 3.9",
+        ]
+        assert client._client.get.call_count == 2
+
+
+class TestPackageFiles:
+    def test_parses_files_and_sizes(self):
+        files = _client_for(FILES_HTML).get_package_files("Ellucian - Ethos Identity 5.10")
+        assert files == [
+            DownloadFile(
+                name="identity-5.10.zip",
+                display_name="identity-5.10.zip",
+                size="250.5 MB",
+                date="",
+                download_url="https://download.flexnetoperations.com/123/identity-5.10.zip?a=1&b=2",
+            ),
+            DownloadFile(
+                name="readme.txt",
+                display_name="readme.txt",
+                size="4 KB",
+                date="",
+                download_url="https://download.flexnetoperations.com/124/readme.txt",
+            ),
+        ]
+
+
+class TestFilesForProduct:
+    def test_package_name_fetched_directly(self):
+        client = _client_for("")
+        client._client.get.side_effect = lambda url, params: MagicMock(
+            status_code=200, text="" if "lineId" in params else FILES_HTML
+        )
+
+        files = client.get_files_for_product("Ellucian - Ethos Identity 5.10")
+
+        assert [f.name for f in files] == ["identity-5.10.zip", "readme.txt"]
+        assert client._client.get.call_count == 2
+
+    def test_line_id_preferred(self):
+        client = _client_for("")
+        client._client.get.side_effect = lambda url, params: MagicMock(
+            status_code=200, text=PACKAGES_HTML if "lineId" in params else FILES_HTML
+        )
+
+        client.get_files_for_product("Ellucian-Ethos-Identity")
+
+        pkg_ids = [c.kwargs["params"].get("downloadPkgId") for c in client._client.get.call_args_list]
+        # No speculative lookup of the line ID as a package ID
+        assert pkg_ids == [None, "Ellucian - Ethos 5.10"]
+
+
+class TestFilesForProducts:
+    def test_maps_each_product(self):
+        client = _client_for("")
+
+        def fake_get(url, params):
+            if params.get("datatype") == "new":
+                pkg = f"{params['lineId']} 1.0"
+                html = (
+                    '<table><tr><td><a href="/flexnet/operationsportal/entitledDownloadFile.action?'
+                    f'downloadPkgId={pkg}&amp;orgId=001G">{pkg}</a></td></tr></table>'
+                )
+            else:
+                name = params["downloadPkgId"].replace(" ", "-")
+                html = (
+                    f'<table><tr><td><a href="https://download.flexnetoperations.com/{name}.zip" '
+                    f'class="download-link">{name}.zip</a></td><td>1 MB</td></tr></table>'
+                )
+            return MagicMock(status_code=200, text=html)
+
+        client._client.get.side_effect = fake_get
+
+        files = client.get_files_for_products(["Product-A", "Product-B"], concurrency=2)
+
+        assert list(files) == ["Product-A", "Product-B"]
+        assert [f.name for f in files["Product-A"]] == ["Product-A-1.0.zip"]
+        assert [f.name for f in files["Product-B"]] == ["Product-B-1.0.zip"]
+
+
+class TestDownloadFile:
+    DATA = bytes(range(256)) * 40
+
+    def _file(self, size: str = "") -> DownloadFile:
+        return DownloadFile(
+            name="big.zip", display_name="big.zip", size=size, date="",
+            download_url="https://download.flexnetoperations.com/big.zip",
+        )
+
+    def _client(self, accept_ranges: str) -> FlexNetClient:
+        client = _client_for("")
+        headers = {"accept-ranges": accept_ranges, "content-length": str(len(self.DATA))}
+        client._client.head.return_value = MagicMock(status_code=200, headers=headers)
+
+        @contextmanager
+        def fake_stream(method, url, headers=None):
+            if headers and "Range" in headers:
+                start, end = map(int, headers["Range"].removeprefix("bytes=").split("-"))
+                body, status = self.DATA[start:end + 1], 206
+            else:
+                body, status = self.DATA, 200
+            resp = MagicMock(status_code=status, headers={"content-length": str(len(body))})
+            resp.iter_bytes.return_value = [body[i:i + 1000] for i in range(0, len(body), 1000)]
+            yield resp
+
+        client._client.stream.side_effect = fake_stream
+        return client
+
+    @patch("ellucian_support.download.PARALLEL_DOWNLOAD_MIN_BYTES", 1)
+    def test_parallel_ranges(self, tmp_path):
+        client = self._client("bytes")
+        progress = []
+
+        path = client.download_file(self._file(), tmp_path, lambda done, total: progress.append((done, total)))
+
+        assert path.read_bytes() == self.DATA
+        assert client._client.stream.call_count == 4
+        assert progress[-1] == (len(self.DATA), len(self.DATA))
+
+    def test_small_listed_file_skips_head(self, tmp_path):
+        client = self._client("bytes")
+
+        path = client.download_file(self._file(size="10 KB"), tmp_path)
+
+        assert path.read_bytes() == self.DATA
+        client._client.head.assert_not_called()
+        assert client._client.stream.call_count == 1
+
+    @patch("ellucian_support.download.PARALLEL_DOWNLOAD_MIN_BYTES", 1024)
+    def test_large_listed_file_checks_ranges(self, tmp_path):
+        client = self._client("bytes")
+
+        client.download_file(self._file(size="10 KB"), tmp_path)
+
+        client._client.head.assert_called_once()
+        assert client._client.stream.call_count == 4
+
+    @patch("ellucian_support.download.PARALLEL_DOWNLOAD_MIN_BYTES", 1)
+    def test_many_small_chunks(self, tmp_path):
+        # Far more chunks than IOV_MAX (1024 on Linux); each writev must stay under the limit
+        client = self._client("none")
+        stream = client._client.stream.side_effect
+
+        @contextmanager
+        def tiny_chunks(method, url, headers=None):
+            with stream(method, url, headers) as resp:
+                resp.iter_bytes.return_value = [self.DATA[i:i + 1] for i in range(len(self.DATA))]
+                yield resp
+
+        client._client.stream.side_effect = tiny_chunks
+
+        path = client.download_file(self._file(), tmp_path)
+
+        assert path.read_bytes() == self.DATA
+
+    @patch("ellucian_support.download.PARALLEL_DOWNLOAD_MIN_BYTES", 1)
+    def test_single_stream_without_range_support(self, tmp_path):
+        client = self._client("none")
+
+        path = client.download_file(self._file(), tmp_path)
+
+        assert path.read_bytes() == self.DATA
+        assert client._client.stream.call_count == 1
+
+
+class TestListedSize:
+    def test_parses_units(self):
+        assert _size_bytes("250.5 MB") == int(250.5 * 1024 * 1024)
+        assert _size_bytes("4 kb") == 4096
+        assert _size_bytes("") is None
+        assert _size_bytes("1.2.3 MB") is None
+
+
+class TestWriteBatch:
+    def test_batches_reach_size(self):
+        assert list(_batched([b"ab", b"cd", b"e"], 3)) == [[b"ab", b"cd"], [b"e"]]
+
+    def test_batches_capped_by_chunk_count(self):
+        assert list(_batched([b"a"] * 5, 1024, max_chunks=2)) == [[b"a", b"a"], [b"a", b"a"], [b"a"]]
+
+    def test_short_write_completed(self, tmp_path):
+        path = tmp_path / "out"
+        with open(path, "wb", buffering=0) as f, patch("os.writev", return_value=3):
+            assert _write_batch(f.fileno(), [b"hello", b" world"]) == 11
+        # writev is mocked, so only the remainder after the reported 3 bytes is written
+        assert path.read_bytes() == b"lo world"
+
+    def test_positional_write(self, tmp_path):
+        path = tmp_path / "out"
+        path.write_bytes(b"..........")
+        with open(path, "r+b", buffering=0) as f:
+            _write_batch(f.fileno(), [b"ab", b"cd"], offset=3)
+        assert path.read_bytes() == b"...abcd..."
@@ -0,0 +1,83 @@
+"""Import-time budget for the CLI entry point.
+
+Guards the lazy-import work in cli.py: startup should not pull in the
+HTTP stack, Rich, or per-command submodules until a command needs them.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import ellucian_support
+
+# Cumulative microseconds allowed for `import ellucian_support.cli`
+IMPORT_BUDGET_US = 250_000
+
+# Modules that must stay out of the CLI's import path
+DEFERRED_MODULES = [
+    "httpx",
+    "rich",
+    "ellucian_support.client",
+    "ellucian_support.confluence",
+    "ellucian_support.download",
+    "ellucian_support.fetch",
+    "ellucian_support.release",
+    "ellucian_support.search",
+    "ellucian_support.ticket",
+    "ellucian_support.upgrade",
+]
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    src_dir = str(Path(ellucian_support.__file__).resolve().parents[1])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def _cumulative_us(importtime_log: str, module: str) -> int:
+    """Parse the cumulative time for module from -X importtime output."""
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+class TestCliImportBudget:
+    def test_deferred_modules_not_imported(self):
+        code = (
+            "import sys, ellucian_support.cli\n"
+            f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+        )
+        loaded = _run(code).stdout.strip()
+        assert loaded == ""
+
+    def test_import_time_within_budget(self):
+        log = _run("import ellucian_support.cli", "-X", "importtime").stderr
+        assert _cumulative_us(log, "ellucian_support.cli") < IMPORT_BUDGET_US
+
+
+class TestRenderImport:
+    def test_confluence_render_does_not_load_httpx(self):
+        """Rendering storage XML (tests, dry runs) should not pull in the HTTP stack."""
+        code = "import sys, ellucian_support.confluence\nprint('httpx' in sys.modules)"
+        assert _run(code).stdout.strip() == "False"
+
+
+class TestLazyExports:
+    def test_all_matches_lazy_exports(self):
+        assert sorted(ellucian_support.__all__) == sorted(ellucian_support._EXPORTS)
+
+    def test_exports_resolve(self):
+        for name in ellucian_support.__all__:
+            assert getattr(ellucian_support, name) is not None
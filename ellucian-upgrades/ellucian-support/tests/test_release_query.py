@@ -10,6 +10,7 @@ from ellucian_support.release import (
     Release,
     _fetch_prerequisites,
     _get_related_ids_from_page,
+    enrich_releases,
     query_releases,
 )
 
@@ -219,6 +220,99 @@ class TestFetchPrerequisites:
         assert result == []
 
 
+class TestEnrichReleases:
+    RELATED = {
+        "r1": [_make_tab("Related Defects", "sys_idINd1,d2"), _make_tab("Prerequisite Releases", "sys_idINp1")],
+        "r2": [_make_tab("Related Defects", "sys_idINd2"), _make_tab("Related Enhancements", "sys_idINe1")],
+        "r3": [_make_tab("Prerequisite Releases", "sys_idINp1,p2")],
+    }
+
+    NAMES = {"p1": "BA GENERAL 8.25", "p2": "BA STUDENT 8.36"}
+
+    def _client(self, prereq_status=200, hidden=()):
+        client = MagicMock()
+        client.__enter__.return_value = client
+
+        def mock_get(url, params=None, **kwargs):
+            resp = MagicMock(status_code=200)
+            params = params or {}
+            sys_id = url.rsplit("/", 1)[-1]
+            if url.endswith("/sp/page"):
+                resp.json.return_value = _make_sp_response(self.RELATED[params["sys_id"]])
+            elif url.endswith("/ellucian_product_release"):
+                resp.status_code = prereq_status
+                ids = params["sysparm_query"].removeprefix("sys_idIN").split(",")
+                resp.json.return_value = {"result": [
+                    {"sys_id": i, "short_description": self.NAMES[i]} for i in ids if i not in hidden
+                ]}
+            elif "/ellucian_product_release/" in url:
+                resp.json.return_value = {"result": {"short_description": f"Release {sys_id}"}}
+            elif sys_id == "d1":
+                resp.status_code = 403
+            else:
+                resp.json.return_value = {"result": {"sys_id": sys_id, "number": sys_id.upper()}}
+            return resp
+
+        client.get.side_effect = mock_get
+        return client
+
+    def _releases(self):
+        return [Release(sys_id=s, number=f"PR_{s}", short_description=s) for s in self.RELATED]
+
+    @patch("ellucian_support.release._make_client")
+    def test_batches_and_dedups_lookups(self, mock_make_client):
+        client = mock_make_client.return_value = self._client()
+        messages = []
+
+        r1, r2, r3 = enrich_releases(MagicMock(), self._releases(), batch_size=2, progress_callback=messages.append)
+
+        assert [d.number for d in r1.defects] == ["D2"]
+        assert [d.number for d in r2.defects] == ["D2"]
+        assert [e.number for e in r2.enhancements] == ["E1"]
+        assert r1.prerequisites == ["BA GENERAL 8.25"]
+        assert r3.prerequisites == ["BA GENERAL 8.25", "BA STUDENT 8.36"]
+        urls = [c.args[0] for c in client.get.call_args_list]
+        assert sum(u.endswith("ellucian_product_defect/d2") for u in urls) == 1
+        assert sum(u.endswith("/ellucian_product_release") for u in urls) == 2
+        assert messages == ["  Enriched (1/3) r1", "  Enriched (2/3) r2", "  Enriched (3/3) r3"]
+
+    @patch("ellucian_support.release._make_client")
+    def test_prerequisite_query_refused_falls_back(self, mock_make_client):
+        mock_make_client.return_value = self._client(prereq_status=403)
+
+        releases = enrich_releases(MagicMock(), self._releases())
+
+        assert releases[2].prerequisites == ["Release p1", "Release p2"]
+
+    @patch("ellucian_support.release._make_client")
+    def test_rows_missing_from_query_fetched_individually(self, mock_make_client):
+        # The Table API can drop ACL-restricted rows from a 200 response
+        client = mock_make_client.return_value = self._client(hidden={"p2"})
+
+        releases = enrich_releases(MagicMock(), self._releases())
+
+        assert releases[2].prerequisites == ["BA GENERAL 8.25", "Release p2"]
+        urls = [c.args[0] for c in client.get.call_args_list]
+        assert [u for u in urls if "/ellucian_product_release/" in u] == [
+            "https://elluciansupport.service-now.com/api/now/table/ellucian_product_release/p2"
+        ]
+
+    @patch("ellucian_support.release._PREREQ_IDS_PER_QUERY", 1)
+    @patch("ellucian_support.release._make_client")
+    def test_prerequisite_queries_capped(self, mock_make_client):
+        client = mock_make_client.return_value = self._client()
+
+        releases = enrich_releases(MagicMock(), self._releases())
+
+        assert releases[2].prerequisites == ["BA GENERAL 8.25", "BA STUDENT 8.36"]
+        queries = [
+            c.kwargs["params"]["sysparm_query"]
+            for c in client.get.call_args_list
+            if c.args[0].endswith("/ellucian_product_release")
+        ]
+        assert queries == ["sys_idINp1", "sys_idINp2"]
+
+
 # --- query_releases tests ---
 
 
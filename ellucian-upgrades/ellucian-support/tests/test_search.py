@@ -0,0 +1,178 @@
+"""Tests for search.py — Coveo search requests."""
+
+import base64
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ellucian_support.auth import AuthSession
+from ellucian_support.search import (
+    SearchError,
+    _build_filter_query,
+    _find_token,
+    _shared_client,
+    _token_cache,
+    get_search_token,
+    search,
+)
+
+
+def _jwt(exp: float) -> str:
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{claims}.signature"
+
+
+def _mock_client(token: str = "tok") -> MagicMock:
+    client = MagicMock()
+    page = {"result": {"containers": [{"widgets": [{"data": {"searchToken": token}}]}]}}
+    client.get.return_value = MagicMock(status_code=200, content=json.dumps(page).encode())
+    results = {"totalCount": 1, "results": [{"title": "T", "clickUri": "https://x/kb_knowledge"}]}
+    client.post.return_value = MagicMock(status_code=200, json=MagicMock(return_value=results))
+    return client
+
+
+@pytest.fixture(autouse=True)
+def _fresh_shared_client():
+    _shared_client.cache_clear()
+    _token_cache.clear()
+    yield
+    _shared_client.cache_clear()
+    _token_cache.clear()
+
+
+class TestSearchClient:
+    def test_uses_passed_client(self):
+        client = _mock_client()
+        response = search(AuthSession(cookies={"a": "1"}), "banner", client=client)
+
+        assert response.total_count == 1
+        assert response.results[0].source == "kb"
+        assert client.post.call_args.kwargs["headers"]["Authorization"] == "Bearer tok"
+        assert client.post.call_args.kwargs["data"]["q"] == "banner"
+
+    @patch("httpx.Client")
+    def test_shared_client_reused(self, mock_client_cls):
+        mock_client_cls.return_value = _mock_client()
+        session = AuthSession(cookies={"a": "1"})
+
+        search(session, "banner")
+        search(session, "student")
+
+        mock_client_cls.assert_called_once()
+        assert mock_client_cls.return_value.post.call_count == 2
+
+    def test_shared_client_keeps_no_cookies(self):
+        import httpx
+
+        client = _shared_client()
+        request = httpx.Request("GET", "https://elluciansupport.service-now.com/api/now/sp/page")
+        client.cookies.extract_cookies(httpx.Response(200, headers={"set-cookie": "glide=1"}, request=request))
+
+        assert not client.cookies
+
+    def test_result_cache(self):
+        client = _mock_client()
+        session = AuthSession(cookies={"a": "1"})
+        cache = {}
+
+        first = search(session, "banner", client=client, result_cache=cache)
+        second = search(session, "banner", client=client, result_cache=cache)
+        search(session, "banner", client=client, result_cache=cache, source_filter="kb")
+
+        assert second is first
+        assert client.post.call_count == 2
+
+
+class TestBuildFilterQuery:
+    def test_no_filters(self):
+        assert _build_filter_query() is None
+        assert _build_filter_query(["bogus"], []) is None
+
+    def test_single_source(self):
+        assert _build_filter_query("docs") == '@source=="Zoomin - Ellucian Resources"'
+
+    def test_multiple_values_and_both_filters(self):
+        aq = _build_filter_query(["kb", "bogus", "defect"], ["pdf", "html"])
+        assert aq == (
+            '@source==("ServiceNow - Knowledge - Support", "ServiceNow - Defect - Support")'
+            ' AND @filetype==("pdf", "html")'
+        )
+
+
+class TestFindToken:
+    def test_nested(self):
+        data = {"result": {"containers": [{"rows": [{"columns": [{"widgets": [{"data": {"searchToken": "t"}}]}]}]}]}}
+        assert _find_token(data) == "t"
+
+    def test_skips_empty_values(self):
+        assert _find_token({"searchToken": "", "widget": [{"searchToken": "t"}]}) == "t"
+
+    def test_missing(self):
+        assert _find_token({"result": [1, "two", {"three": None}]}) is None
+
+    def test_deep_nesting(self):
+        data = {"searchToken": "deep"}
+        for _ in range(5000):
+            data = {"child": [data]}
+        assert _find_token(data) == "deep"
+
+
+class TestSearchToken:
+    def test_cached_until_expiry(self):
+        token = _jwt(time.time() + 3600)
+        client = _mock_client(token)
+        session = AuthSession(cookies={"a": "1"})
+
+        assert get_search_token(session, client) == token
+        assert get_search_token(session, client) == token
+        assert client.get.call_count == 1
+
+    def test_expiring_token_refetched(self):
+        client = _mock_client(_jwt(time.time() + 30))
+        session = AuthSession(cookies={"a": "1"})
+
+        get_search_token(session, client)
+        get_search_token(session, client)
+        assert client.get.call_count == 2
+
+    def test_escaped_token_falls_back_to_parse(self):
+        client = _mock_client()
+        client.get.return_value = MagicMock(status_code=200, content=b'{"data": {"searchToken": "a\\/b"}}')
+        assert get_search_token(AuthSession(), client) == "a/b"
+
+    def test_missing_token_raises(self):
+        client = _mock_client()
+        client.get.return_value = MagicMock(status_code=200, content=b'{"data": {"searchToken": ""}}')
+        with pytest.raises(SearchError, match="searchToken not found"):
+            get_search_token(AuthSession(), client)
+
+    def test_sends_only_session_cookies(self):
+        client = _mock_client()
+
+        get_search_token(AuthSession(cookies={"a": "1", "b": "2"}), client)
+        get_search_token(AuthSession(cookies={"c": "3"}), client)
+
+        cookies = [c.kwargs["headers"]["Cookie"] for c in client.get.call_args_list]
+        assert cookies == ["a=1; b=2", "c=3"]
+        client.cookies.set.assert_not_called()
+
+    def test_cached_per_session(self):
+        client = _mock_client(_jwt(time.time() + 3600))
+
+        get_search_token(AuthSession(cookies={"a": "1"}), client)
+        get_search_token(AuthSession(cookies={"a": "2"}), client)
+        assert client.get.call_count == 2
+
+    def test_unauthorized_search_refreshes_token(self):
+        client = _mock_client(_jwt(time.time() + 3600))
+        ok = client.post.return_value
+        client.post.side_effect = [MagicMock(status_code=401), ok]
+        session = AuthSession(cookies={"a": "1"})
+        get_search_token(session, client)
+
+        response = search(session, "banner", client=client)
+
+        assert response.total_count == 1
+        assert client.get.call_count == 2
@@ -1,6 +1,7 @@
 """Tests for upgrade.py — grouping, filtering, module name parsing."""
 
 import json
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -11,6 +12,7 @@ from ellucian_support.upgrade import (
     UpgradeModule,
     UpgradeRound,
     _group_releases,
+    gather_upgrade_round,
     match_installed_versions,
     parse_module_name,
     should_exclude,
@@ -46,6 +48,15 @@ class TestParseModuleName:
         # Edge case: all tokens look like version numbers
         assert parse_module_name("9.3.57") == "9.3.57"
 
+    def test_multiple_version_tokens(self):
+        assert parse_module_name("BA FIN AID 8.55 1 2") == "BA FIN AID"
+
+    def test_digit_inside_name_kept(self):
+        assert parse_module_name("BA HR 1099 Reporting 9.3") == "BA HR 1099 Reporting"
+
+    def test_inner_whitespace_collapsed(self):
+        assert parse_module_name("BA  FIN\tAID 9.3.57") == "BA FIN AID"
+
     def test_tax_update(self):
         assert parse_module_name("BA HR Tax Update #346") == "BA HR Tax Update"
 
@@ -172,6 +183,21 @@ class TestGroupReleases:
             "BA HR Tax Update #346",
         ]
 
+    def test_tax_updates_sorted_by_number_then_date(self):
+        releases = [
+            self._make_release("BA HR Tax Update #342", target_ga="2026-03-01"),
+            self._make_release("BA HR Tax Update", target_ga="2026-02-01"),
+            self._make_release("BA HR Tax Update #339", target_ga="2026-03-19"),
+            self._make_release("BA HR Tax Update", target_ga="2026-01-01"),
+        ]
+        modules = _group_releases(releases)
+        assert [(r.short_description, r.target_ga_date) for r in modules[0].releases] == [
+            ("BA HR Tax Update", "2026-01-01"),
+            ("BA HR Tax Update", "2026-02-01"),
+            ("BA HR Tax Update #339", "2026-03-19"),
+            ("BA HR Tax Update #342", "2026-03-01"),
+        ]
+
     def test_repost_groups_with_module(self):
         releases = [
             self._make_release("BA FIN AID 9.3.57", target_ga="2026-03-19"),
@@ -224,6 +250,42 @@ class TestUpgradeRoundSerialization:
         assert parsed["title"] == "Test"
         assert parsed["modules"] == []
 
+    @pytest.mark.parametrize("indent", [2, 4, None])
+    def test_streamed_json_matches_dumps(self, indent):
+        round_ = UpgradeRound(
+            title='Spring [2026] "A"',
+            cutoff_date="2026-03-19",
+            modules=[
+                UpgradeModule(
+                    name="BA FIN AID",
+                    releases=[Release(sys_id="a", number="PR1", short_description="line\nbreak")],
+                ),
+                UpgradeModule(name="BA GENERAL"),
+            ],
+        )
+        assert round_.to_json(indent=indent) == json.dumps(round_.to_dict(), indent=indent)
+
+    def test_instances_are_slotted(self):
+        round_ = UpgradeRound(title="Test", cutoff_date="2026-01-01", modules=[UpgradeModule(name="BA A")])
+        assert not hasattr(round_, "__dict__")
+        assert not hasattr(round_.modules[0], "__dict__")
+
+    def test_escaped_names_not_serialized(self):
+        round_ = UpgradeRound(
+            title="Test", cutoff_date="2026-01-01",
+            modules=[UpgradeModule(name="BA A&B"), UpgradeModule(name="BA <C>")],
+        )
+        assert round_.modules[0].escaped_name == "BA A&amp;B"
+        assert round_.modules[1].escaped_name == "BA &lt;C&gt;"
+        assert "escaped_name" not in round_.modules[0].to_dict()
+        assert UpgradeRound.from_json(round_.to_json()) == round_
+
+    def test_escaped_name_follows_renames(self):
+        module = UpgradeModule(name="BA A&B")
+        assert module.escaped_name == "BA A&amp;B"
+        module.name = "BA <C>"
+        assert module.escaped_name == "BA &lt;C&gt;"
+
 
 class TestEsmToModuleMapping:
     def test_mapping_is_bidirectional(self):
@@ -248,6 +310,12 @@ class TestEsmToModuleMapping:
         assert MODULE_TO_ESM["BA FIN AID"] == "Financial Aid"
         assert MODULE_TO_ESM["BA FINANCE"] == "Finance"
 
+    def test_mappings_are_read_only(self):
+        with pytest.raises(TypeError):
+            ESM_TO_MODULE["New Product"] = "BA NEW"
+        with pytest.raises(TypeError):
+            MODULE_TO_ESM["BA NEW"] = "New Product"
+
     def test_no_duplicate_values(self):
         """Each ServiceNow module name should map to exactly one ESM name."""
         module_names = list(ESM_TO_MODULE.values())
@@ -316,6 +384,17 @@ class TestMatchInstalledVersions:
         result = match_installed_versions({}, self._make_round())
         assert result == {}
 
+    def test_more_esm_products_than_modules(self):
+        esm_versions = {
+            "Financial Aid": "9.3.56",
+            "Finance": "9.13",
+            "HR": "9.10",
+            "Student": "9.3.40",
+            "Some Unknown Product": "1.0",
+        }
+        result = match_installed_versions(esm_versions, self._make_round())
+        assert result == {"BA FIN AID": "9.3.56", "BA FINANCE": "9.13"}
+
     def test_partial_match(self):
         """Only some ESM products match modules in the round."""
         esm_versions = {
@@ -324,3 +403,56 @@ class TestMatchInstalledVersions:
         result = match_installed_versions(esm_versions, self._make_round())
         assert result == {"BA FIN AID": "9.3.56"}
         assert len(result) == 1
+
+
+class TestGatherUpgradeRound:
+    def _releases(self, *descs):
+        return [Release(sys_id=d, number=f"PR_{d}", short_description=d) for d in descs]
+
+    @patch("ellucian_support.upgrade.enrich_releases")
+    @patch("ellucian_support.upgrade.query_releases")
+    def test_enriches_filtered_releases(self, mock_query, mock_enrich):
+        mock_query.return_value = self._releases("BA FIN AID 9.3.57", "Banner SaaS Voyager 2026.1", "BA GENERAL 8.26")
+
+        round_ = gather_upgrade_round(MagicMock(), "Spring 2026", "2026-03-19", concurrency=3)
+
+        enriched = mock_enrich.call_args.args[1]
+        assert [r.short_description for r in enriched] == ["BA FIN AID 9.3.57", "BA GENERAL 8.26"]
+        assert mock_enrich.call_args.kwargs["concurrency"] == 3
+        assert [m.name for m in round_.modules] == ["BA FIN AID", "BA GENERAL"]
+
+    @patch("ellucian_support.upgrade.query_releases")
+    def test_dedups_recent_releases(self, mock_query):
+        upcoming = self._releases("BA FIN AID 9.3.57", "BA GENERAL 8.26")
+        recent = self._releases("BA GENERAL 8.26", "BA FINANCE 9.14")
+        mock_query.side_effect = [upcoming, recent]
+
+        round_ = gather_upgrade_round(MagicMock(), "Spring 2026", "2026-03-19", since_date="2025-12-12", enrich=False)
+
+        releases = [r for m in round_.modules for r in m.releases]
+        assert [r.short_description for r in releases] == ["BA FIN AID 9.3.57", "BA GENERAL 8.26", "BA FINANCE 9.14"]
+        assert releases[1] is upcoming[1]
+
+    @patch("ellucian_support.upgrade.query_releases")
+    def test_counts_each_excluded_release_once(self, mock_query):
+        upcoming = self._releases("BA FIN AID 9.3.57", "Banner SaaS Voyager 2026.1")
+        recent = self._releases("Banner SaaS Voyager 2026.1", "BA Texas 1098T 9.2")
+        mock_query.side_effect = [upcoming, recent]
+        messages = []
+
+        round_ = gather_upgrade_round(
+            MagicMock(), "Spring 2026", "2026-03-19", since_date="2025-12-12", enrich=False,
+            progress_callback=messages.append,
+        )
+
+        assert [m.name for m in round_.modules] == ["BA FIN AID"]
+        assert any(m.startswith("  Excluded 2 releases") for m in messages)
+
+    @patch("ellucian_support.upgrade.enrich_releases")
+    @patch("ellucian_support.upgrade.query_releases")
+    def test_no_enrich(self, mock_query, mock_enrich):
+        mock_query.return_value = self._releases("BA FIN AID 9.3.57")
+
+        gather_upgrade_round(MagicMock(), "Spring 2026", "2026-03-19", enrich=False)
+
+        mock_enrich.assert_not_called()